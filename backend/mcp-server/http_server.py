@@ -3,7 +3,12 @@ NYC POI Concierge - HTTP API Server
 Exposes MCP tools as RESTful HTTP endpoints for ngrok/mobile integration
 """
 
+import base64
+import functools
 import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,78 +16,175 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict
+from typing import Any, List, Optional
+import orjson
 import uvicorn
 import asyncio
 import time
 import logging
 
-from src.utils.mongodb import MongoDBClient
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument, UpdateOne
+
+from src.utils.cache import ResponseCache, make_key
+from src.utils.mongodb import AsyncMongoDBClient
+from src.utils.projection import EMBEDDING_EXCLUSION, project_fields
+from src.utils.singleflight import single
 from src.config import config
 
-# Configure logging
+# Configure logging (WARNING by default; set LOG_LEVEL=INFO/DEBUG when debugging)
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True  # src.utils.mongodb calls basicConfig(INFO) on import
 )
 logger = logging.getLogger(__name__)
 
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize BSON types orjson doesn't know natively (datetimes it handles itself)"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson's Rust encoder instead of stdlib json.
+    
+    ObjectIds are stringified during encoding, so handlers can return Mongo
+    documents as-is instead of converting _id in a Python loop.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route whose handler's return value goes straight to ORJSONResponse.
+    
+    With response_model=None FastAPI would still run jsonable_encoder over
+    a returned dict (walking every document in Python, and failing on
+    ObjectId); handing it to the response class directly skips that pass.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        @functools.wraps(endpoint)
+        async def encode(*args, **kw):
+            result = await endpoint(*args, **kw)
+            return result if isinstance(result, Response) else ORJSONResponse(result)
+        
+        super().__init__(path, encode, **kwargs)
+
+
+# UTC timestamp for responses, reformatted once a second by a lifespan task
+# instead of on every request
+_now_iso = ""
+
+
+def _refresh_now_iso():
+    global _now_iso
+    _now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+async def _tick():
+    while True:
+        _refresh_now_iso()
+        await asyncio.sleep(1)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open one pooled MongoDB client at startup and share it via app.state.
+
+    minPoolSize keeps warm connections around so the first requests after
+    boot don't pay the TCP + TLS + auth handshake.
+    """
+    mongo = AsyncMongoDBClient(
+        config.mongodb.uri,
+        config.mongodb.database,
+        config.mongodb.pois_collection,
+        **config.mongodb.client_kwargs(maxPoolSize=100, minPoolSize=10, socketTimeoutMS=5000)
+    )
+    if not await mongo.connect():
+        raise RuntimeError("Failed to connect to MongoDB")
+    app.state.mongo = mongo
+    _refresh_now_iso()
+    ticker = asyncio.create_task(_tick())
+    try:
+        yield
+    finally:
+        ticker.cancel()
+        mongo.close()
+
+
 app = FastAPI(
     title="NYC POI Concierge API",
     description="Prestige-first restaurant recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
+app.router.route_class = ORJSONRoute
 
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    
-    # Log incoming request
-    logger.info(f"🔵 INCOMING: {request.method} {request.url.path}")
-    logger.info(f"   Headers: {dict(request.headers)}")
-    logger.info(f"   Client: {request.client.host if request.client else 'unknown'}")
+class ErrorLoggingMiddleware:
+    """
+    Log requests that fail with an unhandled exception.
     
-    # Process request
-    try:
-        response = await call_next(request)
-        duration = time.time() - start_time
-        
-        # Log response
-        logger.info(f"✅ RESPONSE: {request.method} {request.url.path} - Status: {response.status_code} - Duration: {duration:.2f}s")
-        
-        return response
-    except Exception as e:
-        duration = time.time() - start_time
-        logger.error(f"❌ ERROR: {request.method} {request.url.path} - {str(e)} - Duration: {duration:.2f}s")
-        raise
+    Plain ASGI (no BaseHTTPMiddleware, no header/client materialization), so
+    the success path is a single await; routine per-request logging is left
+    to uvicorn's access log.
+    """
+
+    def __init__(self, app):
+        self.app = app
 
-# Enable CORS for mobile app
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            duration = time.perf_counter() - start_time
+            logger.error(f"❌ ERROR: {scope['method']} {scope['path']} - {str(e)} - Duration: {duration:.2f}s")
+            raise
+
+app.add_middleware(ErrorLoggingMiddleware)
+
+# Enable CORS for the Expo web build (set CORS_ALLOW_ORIGINS); an explicit
+# origin list lets browsers cache preflights for max_age seconds
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=config.http.cors_allow_origins,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=config.http.cors_max_age,
 )
 
-# Global MongoDB client
-mongo_client = None
-
-async def get_mongo():
-    """Get or create MongoDB connection"""
-    global mongo_client
-    if not mongo_client:
-        mongo_client = MongoDBClient()
-        if not mongo_client.connect():
-            raise HTTPException(status_code=500, detail="Failed to connect to MongoDB")
-    return mongo_client
+# POI payloads are text-heavy JSON; compress anything over 1 KB for mobile
+# clients (level 5 trades a little ratio for much less CPU than level 9)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Request/Response Models
 class QueryPOIsRequest(BaseModel):
+    # Unknown keys (the app also sends time_of_day) are dropped, not rejected
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     latitude: float
     longitude: float
     radius_meters: int = 2000
@@ -90,8 +192,53 @@ class QueryPOIsRequest(BaseModel):
     subcategory: Optional[str] = None  # For breakfast, coffee, brunch, etc.
     min_prestige_score: int = 0
     limit: int = 10
+    cursor: Optional[str] = None  # Opaque next_cursor from the previous page
+    fields: Optional[List[str]] = None  # POI fields to return (default: what the app renders)
+
+
+def encode_page_cursor(poi: dict) -> str:
+    """Encode the sort keys of the last POI on a page as an opaque cursor"""
+    keys = {
+        # A missing score sorts as null, so it's encoded as one
+        "s": (poi.get("prestige") or {}).get("score"),
+        "d": poi["distance"],
+        "id": str(poi["_id"]),
+    }
+    return base64.urlsafe_b64encode(orjson.dumps(keys)).decode()
+
+
+def keyset_match(cursor: str, distance_first: bool) -> dict:
+    """
+    Build a $match that resumes right after the POI encoded in `cursor`.
+
+    Mirrors the active sort order (distance/prestige, then _id as tiebreaker)
+    so each page costs O(page size) instead of re-reading every earlier page.
+    """
+    try:
+        keys = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        score, distance, oid = keys["s"], keys["d"], ObjectId(keys["id"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    
+    # prestige.score sorts descending with null/missing last, so what comes
+    # after a null score is only more nulls (equality on None matches both)
+    lower_scores = [{"prestige.score": {"$lt": score}}, {"prestige.score": None}] if score is not None else []
+    
+    if distance_first:
+        return {"$or": [
+            {"distance": {"$gt": distance}},
+            *({"distance": distance, **lower} for lower in lower_scores),
+            {"distance": distance, "prestige.score": score, "_id": {"$gt": oid}},
+        ]}
+    return {"$or": [
+        *lower_scores,
+        {"prestige.score": score, "distance": {"$gt": distance}},
+        {"prestige.score": score, "distance": distance, "_id": {"$gt": oid}},
+    ]}
 
 class ContextualRecommendationsRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     latitude: float
     longitude: float
     radius_meters: int = 3000
@@ -99,6 +246,99 @@ class ContextualRecommendationsRequest(BaseModel):
     weather_condition: Optional[str] = None
     time_of_day: Optional[str] = None
     limit: int = 5
+    fields: Optional[List[str]] = None  # POI fields to return (default: what the app renders)
+
+class RefreshBatchRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    ids: List[str]
+    force: bool = False
+
+
+# Concurrent Tavily refreshes allowed per batch request
+REFRESH_CONCURRENCY = 8
+
+# Coordinate sanitization happens inside the aggregation: the bounds ride
+# along in $geoNear.query (NaN and non-numeric values fail the range checks)
+# and the surviving POIs get their coordinates rounded server-side
+_VALID_COORDINATES = {
+    "location.coordinates.0": {"$gte": -180, "$lte": 180},  # longitude range
+    "location.coordinates.1": {"$gte": -90, "$lte": 90},    # latitude range
+}
+_ROUND_COORDINATES_STAGE = {
+    "$addFields": {
+        "location.coordinates": [
+            {"$round": [{"$arrayElemAt": ["$location.coordinates", 0]}, 6]},
+            {"$round": [{"$arrayElemAt": ["$location.coordinates", 1]}, 6]},
+        ]
+    }
+}
+# Pipeline pieces that never change between requests are built once at import;
+# handlers only patch in the per-request coordinates, radius and filters
+_GEO_NEAR_TEMPLATE = {"distanceField": "distance", "spherical": True}
+_DISTANCE_FIRST_SORT = {"$sort": {"distance": 1, "prestige.score": -1, "_id": 1}}
+_PRESTIGE_FIRST_SORT = {"$sort": {"prestige.score": -1, "distance": 1, "_id": 1}}
+_RELEVANCE_SORT = {"$sort": {"relevance_score": -1}}
+
+
+def geo_near_stage(longitude: float, latitude: float, radius_meters: int, query: Optional[dict] = None) -> dict:
+    """Build a $geoNear stage from the shared template"""
+    stage = {
+        **_GEO_NEAR_TEMPLATE,
+        "near": {"type": "Point", "coordinates": [longitude, latitude]},
+        "maxDistance": radius_meters,
+    }
+    if query:
+        stage["query"] = query
+    return {"$geoNear": stage}
+
+
+@lru_cache(maxsize=256)
+def pick_sort_stage(category: Optional[str], subcategory: Optional[str]) -> tuple:
+    """
+    Smart sorting: prioritize distance for casual queries, prestige for fine-dining.
+    
+    Returns (distance_first, sort_stage); _id breaks ties so pagination
+    cursors are stable.
+    """
+    if subcategory or category == 'casual-dining':
+        # For coffee, breakfast, casual - people want nearby!
+        return True, _DISTANCE_FIRST_SORT
+    # For fine-dining, Michelin - people want quality!
+    return False, _PRESTIGE_FIRST_SORT
+
+
+# Hot geo-query results, keyed on a ~100m grid cell plus every filter. With
+# Redis configured the results are shared by every worker and a POI refresh
+# invalidates them everywhere; each worker re-checks Redis after
+# QUERY_CACHE_L1_TTL seconds, so that's the longest another worker can keep
+# serving pre-refresh results. Without Redis each worker caches on its own
+# and a refresh only clears the worker that ran it (others can lag by up to
+# the 60s TTL).
+QUERY_CACHE_L1_TTL = 5
+query_cache = ResponseCache(
+    redis_url=config.cache.redis_url,
+    default_ttl=60,
+    swr_window=0,
+    maxsize=10_000,
+    namespace="nyc-poi-http",
+    l1_ttl=QUERY_CACHE_L1_TTL if config.cache.redis_url else None,
+)
+
+
+def query_cache_key(request: QueryPOIsRequest) -> str:
+    """Cache key for a /query-pois request (lat/lng quantized to 3 decimals)"""
+    return make_key("query_pois", {
+        **request.model_dump(),
+        "latitude": round(request.latitude, 3),
+        "longitude": round(request.longitude, 3),
+    })
+
+
+async def invalidate_query_cache():
+    """Drop cached query results after POI data changes"""
+    await query_cache.invalidate()
+
 
 @app.get("/")
 async def root():
@@ -118,17 +358,17 @@ async def root():
 async def health_check():
     """Detailed health check with MongoDB connection status"""
     try:
-        client = await get_mongo()
-        poi_count = client.pois.count_documents({})
+        poi_count = await app.state.mongo.pois.estimated_document_count()
         return {
             "status": "healthy",
             "database": "connected",
-            "poi_count": poi_count
+            "poi_count": poi_count,
+            "timestamp": _now_iso
         }
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
 
-@app.post("/query-pois")
+@app.post("/query-pois", response_model=None)
 async def query_pois(request: QueryPOIsRequest):
     """
     Search for NYC restaurants with advanced filtering.
@@ -139,96 +379,56 @@ async def query_pois(request: QueryPOIsRequest):
     logger.info(f"📍 Query POIs Request: lat={request.latitude}, lon={request.longitude}, radius={request.radius_meters}")
     logger.debug(f"   Filters: category={request.category}, min_prestige={request.min_prestige_score}, limit={request.limit}")
     
-    try:
-        client = await get_mongo()
-        logger.debug("   MongoDB client obtained")
-        
-        # Build pipeline
-        pipeline = [
-            {
-                "$geoNear": {
-                    "near": {"type": "Point", "coordinates": [request.longitude, request.latitude]},
-                    "distanceField": "distance",
-                    "maxDistance": request.radius_meters,
-                    "spherical": True
-                }
-            }
-        ]
-        
-        # Add filters
-        match_conditions = {"prestige.score": {"$gte": request.min_prestige_score}}
+    distance_first, sort_stage = pick_sort_stage(request.category, request.subcategory)
+    page_match = keyset_match(request.cursor, distance_first) if request.cursor else None
+    
+    async def run_query() -> dict:
+        # Filters go into $geoNear.query so they're applied during the geo
+        # index walk instead of by a separate $match over every nearby POI
+        geo_query = {"prestige.score": {"$gte": request.min_prestige_score}, **_VALID_COORDINATES}
         if request.category:
-            match_conditions["category"] = request.category
+            geo_query["category"] = request.category
         if request.subcategory:
-            match_conditions["subcategories"] = request.subcategory
+            geo_query["subcategories"] = request.subcategory
         
-        if match_conditions:
-            pipeline.append({"$match": match_conditions})
+        # Build pipeline
+        pipeline = [geo_near_stage(request.longitude, request.latitude, request.radius_meters, geo_query)]
         
-        # Smart sorting: prioritize distance for casual queries, prestige for fine-dining
-        if request.subcategory or request.category == 'casual-dining':
-            # For coffee, breakfast, casual - people want nearby!
-            sort_stage = {"$sort": {"distance": 1, "prestige.score": -1}}
-        else:
-            # For fine-dining, Michelin - people want quality!
-            sort_stage = {"$sort": {"prestige.score": -1, "distance": 1}}
+        # Resume after the previous page's last POI
+        if page_match:
+            pipeline.append({"$match": page_match})
         
         pipeline.extend([
             sort_stage,
-            {"$limit": request.limit}
+            {"$limit": request.limit},
+            _ROUND_COORDINATES_STAGE,
+            # Sort keys stay in the projection so next_cursor can be built
+            project_fields(request.fields, required=("prestige.score", "distance"))
         ])
-
         
         logger.debug(f"   Executing aggregation pipeline with {len(pipeline)} stages")
         
         # Execute
-        results = list(client.pois.aggregate(pipeline))
+        cursor = app.state.mongo.pois.aggregate(pipeline).batch_size(config.mongodb.default_batch_size)
+        results = await cursor.to_list(length=request.limit)
         logger.info(f"✅ Found {len(results)} POIs")
         
-        # Sanitize and validate coordinates
-        valid_pois = []
-        for poi in results:
-            try:
-                # Convert ObjectId to string
-                poi["_id"] = str(poi["_id"])
-                
-                # Validate and sanitize coordinates
-                if poi.get("location") and poi["location"].get("coordinates"):
-                    coords = poi["location"]["coordinates"]
-                    
-                    # Ensure coordinates are valid numbers
-                    if (isinstance(coords, list) and len(coords) >= 2 and
-                        isinstance(coords[0], (int, float)) and isinstance(coords[1], (int, float)) and
-                        not (isinstance(coords[0], float) and (coords[0] != coords[0])) and  # NaN check
-                        not (isinstance(coords[1], float) and (coords[1] != coords[1])) and  # NaN check
-                        -180 <= coords[0] <= 180 and  # longitude range
-                        -90 <= coords[1] <= 90):  # latitude range
-                        
-                        # Force to float and round to reasonable precision
-                        poi["location"]["coordinates"] = [
-                            round(float(coords[0]), 6),  # longitude
-                            round(float(coords[1]), 6)   # latitude
-                        ]
-                        valid_pois.append(poi)
-                        logger.debug(f"   ✅ {poi['name']}: coords={poi['location']['coordinates']}")
-                    else:
-                        logger.warning(f"   ⚠️  Invalid coordinates for {poi.get('name', 'unknown')}: {coords}")
-                else:
-                    logger.warning(f"   ⚠️  Missing location data for {poi.get('name', 'unknown')}")
-            except Exception as e:
-                logger.error(f"   ❌ Error sanitizing POI {poi.get('name', 'unknown')}: {str(e)}")
-        
-        logger.info(f"✅ Returning {len(valid_pois)} POIs with valid coordinates (filtered {len(results) - len(valid_pois)})")
+        # A full page means there may be more results after it
+        next_cursor = encode_page_cursor(results[-1]) if results and len(results) == request.limit else None
         
         return {
-            "pois": valid_pois,
-            "count": len(valid_pois)
+            "pois": results,
+            "count": len(results),
+            "next_cursor": next_cursor
         }
+    
+    try:
+        return await query_cache.get_or_compute(query_cache_key(request), run_query)
     except Exception as e:
         logger.error(f"❌ Query failed: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
-@app.post("/recommendations")
+@app.post("/recommendations", response_model=None)
 async def get_recommendations(request: ContextualRecommendationsRequest):
     """
     Get personalized restaurant recommendations based on context.
@@ -237,19 +437,6 @@ async def get_recommendations(request: ContextualRecommendationsRequest):
     Perfect for: "Where should I go for a date night tonight?"
     """
     try:
-        client = await get_mongo()
-        
-        # Build pipeline
-        pipeline = [
-            {
-                "$geoNear": {
-                    "near": {"type": "Point", "coordinates": [request.longitude, request.latitude]},
-                        "distanceField": "distance",
-                    "maxDistance": request.radius_meters,
-                    "spherical": True
-                }
-            }
-        ]
         
         # Add filters (using OR logic for flexibility, or no filter if POI data is incomplete)
         match_conditions = []
@@ -260,10 +447,14 @@ async def get_recommendations(request: ContextualRecommendationsRequest):
         if request.weather_condition:
             match_conditions.append({"best_for.weather": {"$in": ["any", request.weather_condition]}})
         
-        # Only apply match if we have conditions, otherwise get all nearby POIs
-        if match_conditions:
-            pipeline.append({"$match": {"$or": match_conditions}})
-
+        # Build pipeline; filters are pushed into $geoNear.query when present,
+        # otherwise we get all nearby POIs
+        pipeline = [geo_near_stage(
+            request.longitude,
+            request.latitude,
+            request.radius_meters,
+            {"$or": match_conditions} if match_conditions else None
+        )]
         
         # Add relevance scoring
         pipeline.append({
@@ -278,16 +469,14 @@ async def get_recommendations(request: ContextualRecommendationsRequest):
         })
         
         pipeline.extend([
-            {"$sort": {"relevance_score": -1}},
-            {"$limit": request.limit}
+            _RELEVANCE_SORT,
+            {"$limit": request.limit},
+            project_fields(request.fields, required=("relevance_score",))
         ])
         
         # Execute
-        results = list(client.pois.aggregate(pipeline))
-        
-        # Convert ObjectId to string
-        for poi in results:
-            poi["_id"] = str(poi["_id"])
+        cursor = app.state.mongo.pois.aggregate(pipeline).batch_size(config.mongodb.default_batch_size)
+        results = await cursor.to_list(length=request.limit)
         
         # Build explanation
         context_parts = []
@@ -308,14 +497,31 @@ async def get_recommendations(request: ContextualRecommendationsRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Recommendations failed: {str(e)}")
 
+def build_update_fields(poi: dict, updated_data: dict) -> dict:
+    """Merge a Tavily refresh result into the $set fields for a POI"""
+    update_fields = {
+        "last_validated": datetime.now(),
+    }
+    
+    # Merge updated data
+    if updated_data.get("contact"):
+        update_fields["contact"] = {**poi.get("contact", {}), **updated_data["contact"]}
+    if updated_data.get("hours"):
+        update_fields["hours"] = updated_data["hours"]
+    if updated_data.get("social"):
+        update_fields["social"] = {**poi.get("social", {}), **updated_data["social"]}
+    
+    # Store enrichment data for display (Tavily insights)
+    if updated_data.get("enrichment_data"):
+        update_fields["enrichment_data"] = updated_data["enrichment_data"]
+    
+    return update_fields
+
 @app.get("/poi/{poi_id}/freshness")
 async def check_poi_freshness(poi_id: str):
     """Check when POI was last validated"""
     try:
-        client = await get_mongo()
-        from bson import ObjectId
-        
-        poi = client.pois.find_one({"_id": ObjectId(poi_id)})
+        poi = await app.state.mongo.pois.find_one({"_id": ObjectId(poi_id)}, {"last_validated": 1})
         
         if not poi:
             raise HTTPException(status_code=404, detail="POI not found")
@@ -328,7 +534,6 @@ async def check_poi_freshness(poi_id: str):
                 "updated_at": None
             }
         
-        from datetime import datetime
         age = datetime.now() - last_validated
         age_hours = age.total_seconds() / 3600
         
@@ -340,16 +545,13 @@ async def check_poi_freshness(poi_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Freshness check failed: {str(e)}")
 
-@app.post("/poi/{poi_id}/refresh")
+@app.post("/poi/{poi_id}/refresh", response_model=None)
 async def refresh_poi(poi_id: str, force: bool = False):
     """Refresh POI data using Tavily"""
     try:
         from src.utils.tavily_enrichment import refresh_poi_data
-        from bson import ObjectId
-        from datetime import datetime
         
-        client = await get_mongo()
-        poi = client.pois.find_one({"_id": ObjectId(poi_id)})
+        poi = await app.state.mongo.pois.find_one({"_id": ObjectId(poi_id)}, EMBEDDING_EXCLUSION)
         
         if not poi:
             raise HTTPException(status_code=404, detail="POI not found")
@@ -360,7 +562,6 @@ async def refresh_poi(poi_id: str, force: bool = False):
             if last_validated:
                 age = datetime.now() - last_validated
                 if age.total_seconds() < 86400:  # 24 hours
-                    poi["_id"] = str(poi["_id"])
                     return {
                         "message": "POI is fresh, no refresh needed",
                         "poi": poi
@@ -368,38 +569,23 @@ async def refresh_poi(poi_id: str, force: bool = False):
         
         # Refresh with Tavily
         logger.info(f"🔄 Refreshing POI: {poi.get('name')}")
-        updated_data = await refresh_poi_data(poi)
+        # Concurrent refreshes of the same POI share one Tavily fetch
+        updated_data = await single(f"refresh:{poi_id}", lambda: refresh_poi_data(poi))
         
         # Update MongoDB
-        update_fields = {
-            "last_validated": datetime.now(),
-        }
-        
-        # Merge updated data
-        if updated_data.get("contact"):
-            update_fields["contact"] = {**poi.get("contact", {}), **updated_data["contact"]}
-        if updated_data.get("hours"):
-            update_fields["hours"] = updated_data["hours"]
-        if updated_data.get("social"):
-            update_fields["social"] = {**poi.get("social", {}), **updated_data["social"]}
-        
-        # Store enrichment data for display (Tavily insights)
-        if updated_data.get("enrichment_data"):
-            update_fields["enrichment_data"] = updated_data["enrichment_data"]
+        update_fields = build_update_fields(poi, updated_data)
         
-        client.pois.update_one(
+        # Update and read back the new document in one round-trip
+        updated_poi = await app.state.mongo.pois.find_one_and_update(
             {"_id": ObjectId(poi_id)},
-            {"$set": update_fields}
+            {"$set": update_fields},
+            projection=EMBEDDING_EXCLUSION,
+            return_document=ReturnDocument.AFTER
         )
-        
-        # Return updated POI
-        updated_poi = client.pois.find_one({"_id": ObjectId(poi_id)})
+        await invalidate_query_cache()
         
         logger.info(f"✅ POI refreshed: {updated_poi.get('name')}")
         
-        # Convert ObjectId to string for JSON serialization
-        updated_poi["_id"] = str(updated_poi["_id"])
-        
         return {
             "message": "POI refreshed successfully",
             "poi": updated_poi,
@@ -410,15 +596,93 @@ async def refresh_poi(poi_id: str, force: bool = False):
         logger.error(f"❌ Refresh failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Refresh failed: {str(e)}")
 
+@app.post("/pois/refresh-batch", response_model=None)
+async def refresh_poi_batch(request: RefreshBatchRequest):
+    """
+    Refresh several POIs with Tavily concurrently.
+    
+    The POIs are fetched with one $in query, the Tavily lookups overlap
+    (at most REFRESH_CONCURRENCY at a time) and every update goes back in a
+    single bulk_write.
+    """
+    from src.utils.tavily_enrichment import refresh_poi_data
+    
+    try:
+        oids = [ObjectId(poi_id) for poi_id in request.ids]
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid POI id")
+    
+    try:
+        cursor = app.state.mongo.pois.find(
+            {"_id": {"$in": oids}}, EMBEDDING_EXCLUSION
+        ).batch_size(config.mongodb.default_batch_size)
+        pois = await cursor.to_list(length=len(oids))
+        
+        if not request.force:
+            now = datetime.now()
+            pois = [
+                poi for poi in pois
+                if not poi.get("last_validated") or (now - poi["last_validated"]).total_seconds() >= 86400
+            ]
+        
+        sem = asyncio.Semaphore(REFRESH_CONCURRENCY)
+        
+        async def _refresh_one(poi):
+            async with sem:
+                return await refresh_poi_data(poi)
+        
+        updates = await asyncio.gather(*[_refresh_one(poi) for poi in pois], return_exceptions=True)
+        
+        operations = []
+        refreshed = []
+        failed = {}
+        for poi, updated_data in zip(pois, updates):
+            poi_id = str(poi["_id"])
+            if isinstance(updated_data, Exception):
+                logger.error(f"❌ Refresh failed for {poi_id}: {updated_data}")
+                failed[poi_id] = str(updated_data)
+                continue
+            operations.append(UpdateOne({"_id": poi["_id"]}, {"$set": build_update_fields(poi, updated_data)}))
+            refreshed.append(poi_id)
+        
+        if operations:
+            await app.state.mongo.pois.bulk_write(operations, ordered=False)
+            await invalidate_query_cache()
+        
+        # Anything neither refreshed nor failed was missing or still fresh
+        handled = {*refreshed, *failed}
+        
+        return {
+            "refreshed": refreshed,
+            "failed": failed,
+            "skipped": [poi_id for poi_id in request.ids if poi_id not in handled],
+            "count": len(refreshed)
+        }
+    except Exception as e:
+        logger.error(f"❌ Batch refresh failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch refresh failed: {str(e)}")
+
 if __name__ == "__main__":
     print("🚀 Starting NYC POI Concierge HTTP API Server...")
     print("📍 Local: http://localhost:8000")
     print("📖 Docs: http://localhost:8000/docs")
     print("🔧 Health: http://localhost:8000/health")
     
+    # One worker process per spare core so JSON encoding and validation aren't
+    # capped by a single GIL; each worker opens its own Mongo pool in lifespan.
+    # Override with WEB_CONCURRENCY (e.g. WEB_CONCURRENCY=1 for debugging).
+    workers = int(os.getenv("WEB_CONCURRENCY", max(2, (os.cpu_count() or 1) - 1)))
+    
+    # uvloop (libuv event loop) + httptools (C HTTP parser) instead of the
+    # default asyncio loop and pure-Python h11 parser. Multiple workers need
+    # the app as an import string so each process can load it.
     uvicorn.run(
-        app,
+        "http_server:app",
+        app_dir=str(Path(__file__).parent),
         host="0.0.0.0",
         port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
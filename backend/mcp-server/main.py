@@ -6,17 +6,30 @@ Wraps the MCP server for cloud deployment
 import asyncio
 from datetime import datetime
 
+from pydantic import BaseModel, ConfigDict
+from pymongo import ReturnDocument
 from mcp.server.fastmcp import FastMCP
 from mcp_agent.app import MCPApp
 
 from src.config import config
-from src.resources import RESOURCE_MAP
-from src.utils.mongodb import MongoDBClient
+from src.resources import (
+    RESOURCE_MAP,
+    get_resource_text,
+    guides_for_occasion,
+    normalize_occasion,
+)
+from src.utils.cache import ResponseCache
+from src.utils.mongodb import AsyncMongoDBClient
+from src.utils.projection import EMBEDDING_EXCLUSION, project_fields
 from src.utils.scoring import (
+    TIME_OF_DAY_BY_HOUR,
     combine_score_components,
+    composite_score_expression,
+    context_reasons_expression,
     contextual_boost_expression,
     hybrid_score_expression,
 )
+from src.utils.singleflight import single
 from src.utils.tavily_enrichment import enrich_poi_live as tavily_enrich
 
 # Initialize app
@@ -35,7 +48,7 @@ app = MCPApp(name="nyc-poi-concierge", mcp=mcp_server)
 )
 async def neighborhoods_resource():
     """Static guide cards for flagship neighborhoods."""
-    return RESOURCE_MAP["nyc-poi://guides/neighborhoods"]["data"]
+    return get_resource_text("nyc-poi://guides/neighborhoods")
 
 
 @mcp_server.resource(
@@ -46,36 +59,79 @@ async def neighborhoods_resource():
 )
 async def taxonomy_resource():
     """Prestige-first taxonomy referenced by the tools."""
-    return RESOURCE_MAP["nyc-poi://taxonomy/categories"]["data"]
+    return get_resource_text("nyc-poi://taxonomy/categories")
 
 # Global MongoDB client
 mongo_client = None
 
+# Tool results are deterministic over short windows; repeat calls are served
+# from cache (stale entries refresh in the background)
+tool_cache = ResponseCache(
+    redis_url=config.cache.redis_url,
+    default_ttl=config.cache.default_ttl_s,
+    swr_window=config.cache.swr_window_s,
+    maxsize=config.cache.l1_maxsize,
+)
+
+
+def _no_error(result: dict) -> bool:
+    """Only successful results are cached; errors (bad id, Mongo hiccup) are retried"""
+    return "error" not in result
+
+
+# Tool results must be plain JSON, so ObjectIds are stringified by MongoDB
+# as the last pipeline stage rather than per document in Python
+_STRING_ID_STAGE = {"$addFields": {"_id": {"$toString": "$_id"}}}
+
+
 async def init_mongo():
     """Initialize MongoDB connection"""
     global mongo_client
     if not mongo_client:
-        mongo_client = MongoDBClient()
-        if not mongo_client.connect():
+        mongo_client = AsyncMongoDBClient(
+            config.mongodb.uri,
+            config.mongodb.database,
+            config.mongodb.pois_collection,
+            **config.mongodb.client_kwargs()
+        )
+        if not await mongo_client.connect():
             raise RuntimeError("Failed to connect to MongoDB")
     return mongo_client
 
-@app.tool
-async def query_pois(
+class POIQuery(BaseModel):
+    """One search in a query_pois_batch call (same arguments as query_pois)"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    latitude: float
+    longitude: float
+    radius_meters: int = 2000
+    category: str | None = None
+    min_prestige_score: int = 0
+    limit: int = 10
+    occasion: str | None = None
+    time_of_day: str | None = None
+    weather_condition: str | None = None
+    fields: list[str] | None = None
+
+
+def _query_pois_pipeline(
     latitude: float,
     longitude: float,
-    radius_meters: int = 2000,
-    category: str | None = None,
-    min_prestige_score: int = 0,
-    limit: int = 10,
-    occasion: str | None = None,
-    time_of_day: str | None = None,
-    weather_condition: str | None = None,
-) -> dict:
-    """
-    Search for NYC restaurants using a hybrid prestige + proximity + context score.
-    """
-    client = await init_mongo()
+    radius_meters: int,
+    category: str | None,
+    min_prestige_score: int,
+    limit: int,
+    occasion: str | None,
+    time_of_day: str | None,
+    weather_condition: str | None,
+    fields: list[str] | None,
+) -> list[dict]:
+    """Aggregation pipeline behind query_pois (occasion already normalized)"""
+    # Filters are pushed into $geoNear.query so they run during the geo index walk
+    match_conditions = {"prestige.score": {"$gte": min_prestige_score}}
+    categories = [category] if category else None
+    if categories:
+        match_conditions["category"] = {"$in": categories}
     
     pipeline = [
         {
@@ -83,63 +139,113 @@ async def query_pois(
                 "near": {"type": "Point", "coordinates": [longitude, latitude]},
                 "distanceField": "distance",
                 "maxDistance": radius_meters,
+                "query": match_conditions,
                 "spherical": True
             }
-        }
+        },
+        # $geoNear emits POIs nearest-first; only score the closest
+        # limit*5 candidates and re-rank that small set below
+        {"$limit": limit * 5}
     ]
     
-    match_conditions = {"prestige.score": {"$gte": min_prestige_score}}
-    categories = [category] if category else None
-    if categories:
-        match_conditions["category"] = {"$in": categories}
-    
-    if match_conditions:
-        pipeline.append({"$match": match_conditions})
-    
-    hybrid_expr = hybrid_score_expression(
-        radius_meters=radius_meters,
+    composite_expr = composite_score_expression(
+        radius_meters,
         categories=categories,
-    )
-    context_expr = contextual_boost_expression(
         occasion=occasion,
         time_of_day=time_of_day,
         weather=weather_condition,
     )
-    composite_expr = combine_score_components(hybrid_expr, context_expr)
     
-    pipeline.append({
-        "$addFields": {
-            "hybrid_score": hybrid_expr,
-            "contextual_score": context_expr,
-            "composite_score": composite_expr,
-        }
-    })
+    reasons_expr = context_reasons_expression(
+        occasion=occasion,
+        time_of_day=time_of_day,
+        weather=weather_condition,
+    )
     
     pipeline.extend([
+        {"$addFields": {"composite_score": composite_expr}},
         {"$sort": {"composite_score": -1}},
-        {"$limit": limit}
+        {"$limit": limit},
+        # context_reasons is built server-side for just the returned POIs
+        {"$addFields": {"context_reasons": reasons_expr}},
+        project_fields(fields, required=("context_reasons", "composite_score")),
+        _STRING_ID_STAGE
     ])
+    return pipeline
+
+
+async def _run_query_pois(client, query: POIQuery) -> dict:
+    occasion = normalize_occasion(query.occasion)
+    pipeline = _query_pois_pipeline(
+        query.latitude,
+        query.longitude,
+        query.radius_meters,
+        query.category,
+        query.min_prestige_score,
+        query.limit,
+        occasion,
+        query.time_of_day,
+        query.weather_condition,
+        query.fields,
+    )
+    cursor = client.pois.aggregate(pipeline).batch_size(config.mongodb.default_batch_size)
+    results = await cursor.to_list(length=query.limit)
+    return {
+        "pois": results,
+        "count": len(results)
+    }
+
+
+@app.tool
+@tool_cache.cached("query_pois")
+async def query_pois(
+    latitude: float,
+    longitude: float,
+    radius_meters: int = 2000,
+    category: str | None = None,
+    min_prestige_score: int = 0,
+    limit: int = 10,
+    occasion: str | None = None,
+    time_of_day: str | None = None,
+    weather_condition: str | None = None,
+    fields: list[str] | None = None,
+) -> dict:
+    """
+    Search for NYC restaurants using a hybrid prestige + proximity + context score.
+    `fields` narrows the returned POI fields (defaults to what the app renders).
+    """
+    client = await init_mongo()
+    query = POIQuery(
+        latitude=latitude,
+        longitude=longitude,
+        radius_meters=radius_meters,
+        category=category,
+        min_prestige_score=min_prestige_score,
+        limit=limit,
+        occasion=occasion,
+        time_of_day=time_of_day,
+        weather_condition=weather_condition,
+        fields=fields,
+    )
+    return await _run_query_pois(client, query)
+
+@app.tool
+@tool_cache.cached("query_pois_batch", cacheable=_no_error)
+async def query_pois_batch(queries: list[POIQuery]) -> dict:
+    """
+    Run several query_pois searches (e.g. one per itinerary stop) in one call.
+    The aggregations run concurrently over the shared connection pool;
+    results come back in the same order as `queries`.
+    """
+    max_batch_size = config.mcp.max_batch_size
+    if len(queries) > max_batch_size:
+        return {"error": f"At most {max_batch_size} queries per batch", "results": []}
     
-    results = list(client.pois.aggregate(pipeline))
-    
-    for poi in results:
-        poi["_id"] = str(poi["_id"])
-    
-    enriched_results = []
-    for poi in results:
-        context_reasons = []
-        if occasion and occasion in poi.get("best_for", {}).get("occasions", []):
-            context_reasons.append(occasion.replace("-", " "))
-        if time_of_day and time_of_day in poi.get("best_for", {}).get("time_of_day", []):
-            context_reasons.append(time_of_day)
-        if weather_condition and weather_condition in poi.get("best_for", {}).get("weather", []):
-            context_reasons.append(f"{weather_condition} friendly")
-        poi["context_reasons"] = context_reasons
-        enriched_results.append(poi)
-    
+    client = await init_mongo()
+    results = await asyncio.gather(*(_run_query_pois(client, query) for query in queries))
     return {
-        "pois": enriched_results,
-        "count": len(enriched_results)
+        "results": list(results),
+        "count": len(results)
     }
 
 @app.tool
@@ -153,27 +259,38 @@ async def get_contextual_recommendations(
     limit: int = 5,
     group_size: int = 2,
     budget: str | None = None,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Rank POIs using prestige, proximity, and real-time context (occasion, weather, budget).
+    `fields` narrows the returned POI fields (defaults to what the app renders).
     """
-    client = await init_mongo()
-    
+    # The ranking depends on the time of day, so it's resolved before the
+    # cache lookup and a call without one is keyed on the current bucket
     if time_of_day is None:
         dt = datetime.utcnow() if config.is_production else datetime.now()
-        hour = dt.hour
-        time_of_day = "lunch" if 11 <= hour < 15 else "dinner" if 17 <= hour < 23 else "any"
-    
-    pipeline = [
-        {
-            "$geoNear": {
-                "near": {"type": "Point", "coordinates": [longitude, latitude]},
-                "distanceField": "distance",
-                "maxDistance": radius_meters,
-                "spherical": True
-            }
-        }
-    ]
+        time_of_day = TIME_OF_DAY_BY_HOUR[dt.hour]
+    return await _contextual_recommendations(
+        latitude, longitude, radius_meters, occasion, weather_condition,
+        time_of_day, limit, group_size, budget, fields,
+    )
+
+
+@tool_cache.cached("get_contextual_recommendations")
+async def _contextual_recommendations(
+    latitude: float,
+    longitude: float,
+    radius_meters: int,
+    occasion: str | None,
+    weather_condition: str | None,
+    time_of_day: str,
+    limit: int,
+    group_size: int,
+    budget: str | None,
+    fields: list[str] | None,
+) -> dict:
+    client = await init_mongo()
+    occasion = normalize_occasion(occasion)
     
     match_conditions = []
     if budget and budget != "any":
@@ -186,8 +303,16 @@ async def get_contextual_recommendations(
             ]
         })
     
+    geo_near = {
+        "near": {"type": "Point", "coordinates": [longitude, latitude]},
+        "distanceField": "distance",
+        "maxDistance": radius_meters,
+        "spherical": True
+    }
     if match_conditions:
-        pipeline.append({"$match": {"$and": match_conditions}})
+        geo_near["query"] = {"$and": match_conditions}
+    
+    pipeline = [{"$geoNear": geo_near}]
     
     hybrid_expr = hybrid_score_expression(radius_meters=radius_meters)
     context_expr = contextual_boost_expression(
@@ -207,24 +332,26 @@ async def get_contextual_recommendations(
         }
     })
     
+    reasons_expr = context_reasons_expression(
+        occasion=occasion,
+        time_of_day=time_of_day,
+        weather=weather_condition,
+        budget=budget,
+    )
+    
     pipeline.extend([
         {"$sort": {"relevance_score": -1}},
-        {"$limit": limit}
+        {"$limit": limit},
+        {"$addFields": {"context_reasons": reasons_expr}},
+        project_fields(
+            fields,
+            required=("context_reasons", "hybrid_score", "contextual_score", "relevance_score"),
+        ),
+        _STRING_ID_STAGE
     ])
     
-    results = list(client.pois.aggregate(pipeline))
-    
-    for poi in results:
-        poi["_id"] = str(poi["_id"])
-        poi["context_reasons"] = []
-        if occasion and occasion in poi.get("best_for", {}).get("occasions", []):
-            poi["context_reasons"].append(occasion.replace("-", " "))
-        if time_of_day and time_of_day in poi.get("best_for", {}).get("time_of_day", []):
-            poi["context_reasons"].append(time_of_day)
-        if weather_condition and weather_condition in poi.get("best_for", {}).get("weather", []):
-            poi["context_reasons"].append(f"{weather_condition} friendly")
-        if budget and budget == poi.get("experience", {}).get("price_range"):
-            poi["context_reasons"].append("matches budget")
+    cursor = client.pois.aggregate(pipeline).batch_size(config.mongodb.default_batch_size)
+    results = await cursor.to_list(length=limit)
     
     context_parts = []
     if occasion:
@@ -246,6 +373,7 @@ async def get_contextual_recommendations(
     return {
         "pois": results,
         "explanation": explanation,
+        "neighborhood_guides": [guide["name"] for guide in guides_for_occasion(occasion)],
         "count": len(results)
     }
 
@@ -274,16 +402,22 @@ async def enrich_poi_live(
 
 
 @app.tool
+@tool_cache.cached("check_poi_freshness", cacheable=_no_error)
 async def check_poi_freshness(poi_id: str) -> dict:
     """
     Check when a POI was last validated/updated.
     Returns freshness status and age in hours.
     """
+    # Concurrent checks of the same POI share one Mongo read
+    return await single(f"fresh:{poi_id}", lambda: _check_poi_freshness(poi_id))
+
+
+async def _check_poi_freshness(poi_id: str) -> dict:
     try:
         from bson import ObjectId
         
         client = await init_mongo()
-        poi = client.pois.find_one({"_id": ObjectId(poi_id)})
+        poi = await client.pois.find_one({"_id": ObjectId(poi_id)}, {"last_validated": 1})
         
         if not poi:
             return {"error": "POI not found", "is_fresh": False}
@@ -323,12 +457,17 @@ async def refresh_poi_data(poi_id: str, force: bool = False) -> dict:
     Returns:
         Updated POI data with freshness info
     """
+    # Concurrent refreshes of the same POI share one Tavily fetch and write
+    return await single(f"refresh:{poi_id}:{force}", lambda: _refresh_poi_data(poi_id, force))
+
+
+async def _refresh_poi_data(poi_id: str, force: bool) -> dict:
     try:
         from bson import ObjectId
         from src.utils.tavily_enrichment import refresh_poi_data as tavily_refresh_poi
         
         client = await init_mongo()
-        poi = client.pois.find_one({"_id": ObjectId(poi_id)})
+        poi = await client.pois.find_one({"_id": ObjectId(poi_id)}, EMBEDDING_EXCLUSION)
         
         if not poi:
             return {"error": "POI not found"}
@@ -359,13 +498,14 @@ async def refresh_poi_data(poi_id: str, force: bool = False) -> dict:
         if updated_data.get("social"):
             update_fields["social"] = {**poi.get("social", {}), **updated_data["social"]}
         
-        client.pois.update_one(
+        # Update and read back the new document in one round-trip
+        updated_poi = await client.pois.find_one_and_update(
             {"_id": ObjectId(poi_id)},
-            {"$set": update_fields}
+            {"$set": update_fields},
+            projection=EMBEDDING_EXCLUSION,
+            return_document=ReturnDocument.AFTER
         )
-        
-        # Return updated POI
-        updated_poi = client.pois.find_one({"_id": ObjectId(poi_id)})
+        await tool_cache.invalidate()
         updated_poi["_id"] = str(updated_poi["_id"])
         
         return {
@@ -392,7 +532,7 @@ async def refresh_poi_data(poi_id: str, force: bool = False) -> dict:
 #     return {
 #         "status": "healthy",
 #         "service": "nyc-poi-concierge",
-#         "timestamp": datetime.now().isoformat()
+#         "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds")
 #     }
 
 
@@ -462,4 +602,11 @@ async def refresh_poi_data(poi_id: str, force: bool = False) -> dict:
 
 
 if __name__ == "__main__":
-    asyncio.run(app.run())
+    # libuv-backed event loop when available (not on Windows); every tool is
+    # I/O-bound on Mongo, OpenAI and Tavily, so loop wakeup overhead matters
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(app.run())
+    else:
+        uvloop.run(app.run())
@@ -0,0 +1 @@
+"""NYC POI Concierge MCP Server package"""
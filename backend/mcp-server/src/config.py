@@ -4,100 +4,242 @@ MongoDB x Tavily x LastMile AI Hackathon
 """
 
 import os
-from typing import Optional
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+from typing import Any, Callable, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class MongoDBConfig(BaseModel):
+@cache
+def _env_snapshot() -> Dict[str, str]:
+    """One consistent copy of the environment (call _env_snapshot.cache_clear() to re-read)"""
+    return dict(os.environ)
+
+
+def _get(key: str, default: Any = None, cast: Callable[[str], Any] = str) -> Any:
+    value = _env_snapshot().get(key)
+    return cast(value) if value is not None else default
+
+
+_TRUE = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _get_bool(key: str, default: bool = False) -> bool:
+    value = _env_snapshot().get(key)
+    return default if value is None else value.lower() in _TRUE
+
+
+def _env(key: str, default: str = ""):
+    """default_factory reading an env var when the config is built, not at import"""
+    return lambda: _get(key, default)
+
+
+def _env_int(key: str, default: int):
+    return lambda: _get(key, default, int)
+
+
+@dataclass(frozen=True, slots=True)
+class MongoDBConfig:
     """MongoDB Atlas configuration"""
-    uri: str = os.getenv("MONGODB_URI", "")
-    database: str = os.getenv("MONGODB_DATABASE", "nyc-poi")
-    pois_collection: str = os.getenv("MONGODB_POIS_COLLECTION", "pois")
-    # Timeouts and connection settings
-    max_pool_size: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "10"))
-    server_selection_timeout_ms: int = int(os.getenv("MONGODB_TIMEOUT", "5000"))
-    
+    uri: str = field(default_factory=_env("MONGODB_URI"))
+    database: str = field(default_factory=_env("MONGODB_DATABASE", "nyc-poi"))
+    pois_collection: str = field(default_factory=_env("MONGODB_POIS_COLLECTION", "pois"))
+    # Timeouts and connection settings (the pool is sized for many concurrent
+    # SSE sessions; connections are only opened as load needs them)
+    max_pool_size: int = field(default_factory=_env_int("MONGODB_MAX_POOL_SIZE", 100))
+    server_selection_timeout_ms: int = field(default_factory=_env_int("MONGODB_TIMEOUT", 5000))
+    # Idle pooled connections are closed after this long, so a burst's extra connections don't linger
+    max_idle_time_ms: int = field(default_factory=_env_int("MONGODB_MAX_IDLE_TIME_MS", 60000))
+    # Wire compression (zstd needs the zstandard package; unavailable ones are skipped)
+    compressors: str = field(default_factory=_env("MONGODB_COMPRESSORS", "zstd,zlib"))
+    # Reads go to the primary so a refresh is visible to the next query; set
+    # e.g. secondaryPreferred to spread reads when replica lag is acceptable
+    read_preference: str = field(default_factory=_env("MONGODB_READ_PREFERENCE", "primary"))
+    # Documents per cursor batch, so a typical POI result arrives in one round-trip
+    default_batch_size: int = field(default_factory=_env_int("MONGODB_DEFAULT_BATCH_SIZE", 100))
+
     def __post_init__(self):
         if not self.uri:
             raise ValueError("MONGODB_URI environment variable is required")
 
-
-class TavilyConfig(BaseModel):
+    def client_kwargs(self, **overrides) -> dict:
+        """PyMongo/Motor client options built from this config (overrides win)"""
+        return {
+            "compressors": self.compressors,
+            "readPreference": self.read_preference,
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": min(10, max(2, self.max_pool_size // 4)),
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "retryReads": True,
+            **overrides,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TavilyConfig:
     """Tavily API configuration"""
-    api_key: str = os.getenv("TAVILY_API_KEY", "")
-    search_depth: str = os.getenv("TAVILY_SEARCH_DEPTH", "advanced")
-    max_results: int = int(os.getenv("TAVILY_MAX_RESULTS", "10"))
-    include_raw_content: bool = os.getenv("TAVILY_INCLUDE_RAW", "true").lower() == "true"
-    
+    api_key: str = field(default_factory=_env("TAVILY_API_KEY"))
+    search_depth: str = field(default_factory=_env("TAVILY_SEARCH_DEPTH", "advanced"))
+    max_results: int = field(default_factory=_env_int("TAVILY_MAX_RESULTS", 10))
+    include_raw_content: bool = field(default_factory=lambda: _get_bool("TAVILY_INCLUDE_RAW", True))
+
     def __post_init__(self):
         if not self.api_key:
             raise ValueError("TAVILY_API_KEY environment variable is required")
 
 
-class OpenAIConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class OpenAIConfig:
     """OpenAI API configuration"""
-    api_key: str = os.getenv("OPENAI_API_KEY", "")
-    embedding_model: str = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
-    embedding_dimensions: int = int(os.getenv("OPENAI_EMBEDDING_DIMS", "1536"))
-    chat_model: str = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
-    
+    api_key: str = field(default_factory=_env("OPENAI_API_KEY"))
+    embedding_model: str = field(default_factory=_env("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"))
+    embedding_dimensions: int = field(default_factory=_env_int("OPENAI_EMBEDDING_DIMS", 512))
+    chat_model: str = field(default_factory=_env("OPENAI_CHAT_MODEL", "gpt-4o-mini"))
+
     def __post_init__(self):
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
 
 
-class WeatherConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class WeatherConfig:
     """OpenWeatherMap API configuration"""
-    api_key: str = os.getenv("OPENWEATHER_API_KEY", "")
-    units: str = os.getenv("OPENWEATHER_UNITS", "imperial")  # Fahrenheit for NYC
-    
+    api_key: str = field(default_factory=_env("OPENWEATHER_API_KEY"))
+    units: str = field(default_factory=_env("OPENWEATHER_UNITS", "imperial"))  # Fahrenheit for NYC
+
     def __post_init__(self):
         if not self.api_key:
             raise ValueError("OPENWEATHER_API_KEY environment variable is required")
 
 
-class PerplexityConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PerplexityConfig:
     """Perplexity Sonar API configuration"""
-    api_key: str = os.getenv("PERPLEXITY_API_KEY", "")
-    model: str = os.getenv("PERPLEXITY_MODEL", "sonar")  # "sonar" or "sonar-pro"
-    search_recency_filter: str = os.getenv("PERPLEXITY_RECENCY", "month")  # month, week, day
-    
+    api_key: str = field(default_factory=_env("PERPLEXITY_API_KEY"))
+    model: str = field(default_factory=_env("PERPLEXITY_MODEL", "sonar"))  # "sonar" or "sonar-pro"
+    search_recency_filter: str = field(default_factory=_env("PERPLEXITY_RECENCY", "month"))  # month, week, day
+
     def __post_init__(self):
         if not self.api_key:
             raise ValueError("PERPLEXITY_API_KEY environment variable is required")
 
 
-class MCPConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MCPConfig:
     """MCP Server configuration"""
-    server_name: str = os.getenv("MCP_SERVER_NAME", "nyc-poi-concierge")
-    server_version: str = os.getenv("MCP_SERVER_VERSION", "0.1.0")
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    server_name: str = field(default_factory=_env("MCP_SERVER_NAME", "nyc-poi-concierge"))
+    server_version: str = field(default_factory=_env("MCP_SERVER_VERSION", "0.1.0"))
+    log_level: str = field(default_factory=_env("LOG_LEVEL", "INFO"))
+    # Upper bound on searches accepted by one query_pois_batch call
+    max_batch_size: int = field(default_factory=_env_int("MCP_MAX_BATCH_SIZE", 50))
+    # In-flight OpenAI embedding calls and Tavily enrichments per process
+    # (bursts queue instead of tripping rate limits)
+    max_concurrent_openai: int = field(default_factory=_env_int("MCP_MAX_CONCURRENT_OPENAI", 8))
+    max_concurrent_tavily: int = field(default_factory=_env_int("MCP_MAX_CONCURRENT_TAVILY", 4))
+
+
+def _split_origins() -> Tuple[str, ...]:
+    raw = _get("CORS_ALLOW_ORIGINS", "http://localhost:8081,http://localhost:19006")
+    return tuple(origin.strip() for origin in raw.split(",") if origin.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPConfig:
+    """HTTP API (http_server.py) configuration"""
+    # Comma-separated browser origins allowed to call the API (native apps don't send Origin)
+    cors_allow_origins: Tuple[str, ...] = field(default_factory=_split_origins)
+    # How long browsers may cache a CORS preflight response
+    cors_max_age: int = field(default_factory=_env_int("CORS_MAX_AGE", 86400))
+
+
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
+    """Tool response cache (in-process L1, optional Redis L2)"""
+    redis_url: Optional[str] = field(default_factory=lambda: _get("CACHE_REDIS_URL") or _get("REDIS_URL"))
+    default_ttl_s: int = field(default_factory=_env_int("CACHE_DEFAULT_TTL_S", 30))
+    # Stale entries are still served (and refreshed in the background) this long past their TTL
+    swr_window_s: int = field(default_factory=_env_int("CACHE_SWR_WINDOW_S", 120))
+    l1_maxsize: int = field(default_factory=_env_int("CACHE_L1_MAXSIZE", 1024))
+    # Run the popular-search warm set once when the MCP server starts (off by default)
+    warm_on_start: bool = field(default_factory=lambda: _get_bool("CACHE_WARM_ON_START"))
+    # Warmed entries stay fresh this long (the regular TTL would drop them minutes after startup)
+    warm_ttl_s: int = field(default_factory=_env_int("CACHE_WARM_TTL_S", 3600))
+    # Tavily enrichments (menus, buzz, hours) change over days, so they're kept for hours
+    enrichment_ttl_s: int = field(default_factory=_env_int("CACHE_ENRICHMENT_TTL_S", 6 * 3600))
 
 
 class AppConfig:
-    """Main application configuration"""
-    
-    def __init__(self):
-        self.mongodb = MongoDBConfig()
-        self.tavily = TavilyConfig()
-        self.openai = OpenAIConfig()
-        self.weather = WeatherConfig()
-        self.perplexity = PerplexityConfig()
-        self.mcp = MCPConfig()
-    
-    @property
+    """
+    Main application configuration.
+
+    Each section reads the environment the first time it's accessed, so a
+    process only validates (and requires keys for) the services it uses.
+    """
+
+    @cached_property
+    def mongodb(self) -> MongoDBConfig:
+        return MongoDBConfig()
+
+    @cached_property
+    def tavily(self) -> TavilyConfig:
+        return TavilyConfig()
+
+    @cached_property
+    def openai(self) -> OpenAIConfig:
+        return OpenAIConfig()
+
+    @cached_property
+    def weather(self) -> WeatherConfig:
+        return WeatherConfig()
+
+    @cached_property
+    def perplexity(self) -> PerplexityConfig:
+        return PerplexityConfig()
+
+    @cached_property
+    def mcp(self) -> MCPConfig:
+        return MCPConfig()
+
+    @cached_property
+    def http(self) -> HTTPConfig:
+        return HTTPConfig()
+
+    @cached_property
+    def cache(self) -> CacheConfig:
+        return CacheConfig()
+
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode"""
-        return os.getenv("ENV", "development") == "production"
-    
-    @property
+        return _get("ENV", "development") == "production"
+
+    @cached_property
+    def verbose_startup(self) -> bool:
+        """Report extras like the POI count at startup (off by default in production)"""
+        return _get_bool("VERBOSE_STARTUP", not self.is_production)
+
+    @cached_property
     def use_mock_data(self) -> bool:
         """Check if using mock data (for parallel development)"""
-        return os.getenv("USE_MOCK_DATA", "false").lower() == "true"
+        return _get_bool("USE_MOCK_DATA")
+
+
+@cache
+def get_config() -> AppConfig:
+    """
+    Shared AppConfig singleton.
+
+    To re-read the environment (e.g. in tests), clear both caches:
+    `_env_snapshot.cache_clear(); get_config.cache_clear()`.
+    """
+    return AppConfig()
 
 
-# Global config instance
-config = AppConfig()
+def __getattr__(name: str):
+    # `from config import config` keeps working but builds nothing until first use
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,118 @@
+"""
+Per-POI text rendering for the stdio MCP server's responses.
+
+Kept free of server state and fully annotated so it can be compiled with
+mypyc (`mypyc src/render_poi.py` from backend/mcp-server); the plain Python
+module is used when no compiled build is present.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Per-POI response layouts, parsed once; optional lines are pre-rendered
+# (or left empty) and dropped into their slots
+QUERY_POI_TEMPLATE = (
+    "{i}. **{name}**{stars}\n"
+    "   📍 {street}, {neighborhood}\n"
+    "   📏 Distance: {distance:.0f}m\n"
+    "   ⭐ Prestige Score: {prestige}\n"
+    "{score_line}"
+    "   💰 Price: {price}\n"
+    "   📞 {phone}\n"
+    "{context_line}"
+    "{signature_line}"
+    "\n"
+)
+SCORE_LINE = "   ⚖️ Hybrid Score: {:.1f}\n"
+CONTEXT_LINE = "   🎯 Context fit: {}\n"
+SIGNATURE_LINE = "   🍽️  Signature: {}\n"
+
+RECOMMENDATION_TEMPLATE = (
+    "**{i}. {name}**{stars}\n"
+    "   {neighborhood} · {distance:.0f}m away\n"
+    "   💰 {price} · Prestige: {prestige}{score}\n"
+    "{reasons_line}"
+    "   📞 {phone}\n\n"
+)
+RELEVANCE_SUFFIX = " · ⚖️ {:.1f}"
+REASONS_LINE = "   ✨ {}\n"
+
+VIBE_TEMPLATE = (
+    "**{i}. {name}**{stars}\n"
+    "   📍 {neighborhood}\n"
+    "   🎯 Similarity: {similarity:.2f} | Prestige: {prestige}\n"
+    "   💰 {price} · {cuisine}\n"
+    "{ambiance_line}"
+    "{occasions_line}"
+    "{signature_line}"
+    "   📞 {phone}\n\n"
+)
+AMBIANCE_LINE = "   ✨ Ambiance: {}\n"
+OCCASIONS_LINE = "   🎉 Best for: {}\n"
+VIBE_SIGNATURE_LINE = "   🍽️ Signature: {}\n"
+
+# Michelin star suffixes by star count (no stars renders nothing)
+STAR_STRINGS: Dict[Optional[int], str] = {stars: f" {'⭐' * stars}" for stars in (1, 2, 3)}
+
+
+def render_query_result(i: int, poi: Dict[str, Any], score_field: str) -> str:
+    """One numbered query_pois entry from a flat projected POI"""
+    score = poi.get(score_field)
+    context_reasons: List[str] = poi.get("context_reasons") or []
+    dishes: List[str] = poi.get("signature_dishes") or []
+
+    return QUERY_POI_TEMPLATE.format_map({
+        "i": i,
+        "name": poi["name"],
+        "stars": STAR_STRINGS.get(poi.get("stars"), ""),
+        "street": poi.get("street", "N/A"),
+        "neighborhood": poi.get("neighborhood", ""),
+        "distance": poi.get("distance", 0),
+        "prestige": poi.get("prestige_score", 0),
+        "score_line": SCORE_LINE.format(score) if score else "",
+        "price": poi.get("price_range", "N/A"),
+        "phone": poi.get("phone", "N/A"),
+        "context_line": CONTEXT_LINE.format(", ".join(context_reasons)) if context_reasons else "",
+        "signature_line": SIGNATURE_LINE.format(", ".join(dishes[:2])) if dishes else "",
+    })
+
+
+def render_context_result(i: int, poi: Dict[str, Any]) -> str:
+    """One numbered recommendation with the context reasons MongoDB matched"""
+    score = poi.get("relevance_score")
+    reasons: List[str] = poi.get("context_reasons") or []
+
+    return RECOMMENDATION_TEMPLATE.format_map({
+        "i": i,
+        "name": poi["name"],
+        "stars": STAR_STRINGS.get(poi.get("stars"), ""),
+        "neighborhood": poi.get("neighborhood", ""),
+        "distance": poi.get("distance", 0),
+        "price": poi.get("price_range", "N/A"),
+        "prestige": poi.get("prestige_score", 0),
+        "score": RELEVANCE_SUFFIX.format(score) if score else "",
+        "reasons_line": REASONS_LINE.format(" · ".join(reasons)) if reasons else "",
+        "phone": poi.get("phone", "N/A"),
+    })
+
+
+def render_vibe_result(i: int, poi: Dict[str, Any]) -> str:
+    """One numbered search_by_vibe match and why it fits"""
+    subcategories: List[str] = poi.get("subcategories") or []
+    ambiance: List[str] = poi.get("ambiance") or []
+    occasions: List[str] = poi.get("occasions") or []
+    dishes: List[str] = poi.get("signature_dishes") or []
+
+    return VIBE_TEMPLATE.format_map({
+        "i": i,
+        "name": poi["name"],
+        "stars": STAR_STRINGS.get(poi.get("stars"), ""),
+        "neighborhood": poi.get("neighborhood", "N/A"),
+        "similarity": poi.get("similarity_score", 0),
+        "prestige": poi.get("prestige_score", 0),
+        "price": poi.get("price_range", "N/A"),
+        "cuisine": ", ".join(subcategories[:2]) if subcategories else poi.get("category", "restaurant"),
+        "ambiance_line": AMBIANCE_LINE.format(", ".join(ambiance[:3])) if ambiance else "",
+        "occasions_line": OCCASIONS_LINE.format(", ".join(occasions[:2])) if occasions else "",
+        "signature_line": VIBE_SIGNATURE_LINE.format(", ".join(dishes[:2])) if dishes else "",
+        "phone": poi.get("phone", "N/A"),
+    })
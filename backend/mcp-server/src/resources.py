@@ -3,113 +3,110 @@ Static MCP resources that describe NYC neighborhood playbooks and category taxon
 These resources are exposed both by the FastMCP server (cloud) and the stdio server.
 """
 
-NEIGHBORHOOD_GUIDES = [
-    {
-        "slug": "west-village",
-        "name": "West Village",
-        "vibe": "Candle-lit brownstones, intimate dining rooms, and late-night jazz hideaways.",
-        "best_for": ["date-night", "celebration", "after-work"],
-        "signature_pois": [
-            "Employees Only",
-            "L'Artusi",
-            "Via Carota",
-        ],
-        "must_try": [
-            "9th Street pasta crawl (L'Artusi → I Sodi)",
-            "Speakeasy crawl down Hudson Street",
-        ],
-    },
-    {
-        "slug": "flatiron-nomad",
-        "name": "Flatiron & NoMad",
-        "vibe": "Design-forward dining rooms, chef counter energy, and power lunches that stretch into dinner.",
-        "best_for": ["business-dinner", "business-lunch", "celebration"],
-        "signature_pois": [
-            "Eleven Madison Park",
-            "The NoMad Bar",
-            "Koloman",
-        ],
-        "must_try": [
-            "Chef's tasting at EMP followed by digestifs at The NoMad Bar",
-            "Midday strategy session at Koloman's front café",
-        ],
-    },
-    {
-        "slug": "brooklyn-bridge-corridor",
-        "name": "Brooklyn Heights & DUMBO",
-        "vibe": "Skyline views, riverfront promenades, and inventive tasting menus tucked into restored warehouses.",
-        "best_for": ["family-dinner", "sunset-stroll", "special-occasion"],
-        "signature_pois": [
-            "The River Café",
-            "Vinegar Hill House",
-            "Celestine",
-        ],
-        "must_try": [
-            "Golden hour cocktails underneath the Brooklyn Bridge",
-            "Wood-fired brunch in Vinegar Hill",
-        ],
-    },
-    {
-        "slug": "midtown-power",
-        "name": "Midtown Power Corridor",
-        "vibe": "Marble lobbies, legacy steakhouses, and Michelin-grade temples built for decisive dinners.",
-        "best_for": ["business-dinner", "pre-theatre", "client-win"],
-        "signature_pois": [
-            "Le Bernardin",
-            "The Modern",
-            "Keens Steakhouse",
-        ],
-        "must_try": [
-            "Pre-show tasting menu at The Modern",
-            "Closing toast with a 100-year-old brandy at Keens",
-        ],
-    },
-]
-
-CATEGORY_TAXONOMY = {
-    "fine-dining": {
-        "description": "Michelin-caliber rooms, extended tasting menus, chef tables, and white-glove service.",
-        "prestige_range": "110-150",
-        "ideal_occasions": ["celebration", "date-night", "client-win"],
-        "hallmarks": [
-            "Multi-course tasting menus with optional wine pairings",
-            "Dedicated reservations desk and jacket-friendly dress code",
-            "Signature dish lineage (e.g., EMP's plant-based tasting)",
-        ],
-    },
-    "casual-dining": {
-        "description": "Neighborhood staples with James Beard nods, power lunches, and cult favorite pizzas.",
-        "prestige_range": "70-109",
-        "ideal_occasions": ["family-dinner", "after-work", "weekend-brunch"],
-        "hallmarks": [
-            "Walk-in friendly counters or bar seating",
-            "Chef-driven menus with seasonal specials",
-            "Comfortable price points without sacrificing sourcing",
-        ],
-    },
-    "bars-cocktails": {
-        "description": "Award-winning bar programs, low-lit speakeasies, and zero-proof tasting flights.",
-        "prestige_range": "60-95",
-        "ideal_occasions": ["after-work", "late-night", "date-night"],
-        "hallmarks": [
-            "House clarified milk punches and reserve spirit programs",
-            "Snack menus curated with local purveyors",
-            "Standing room vibes with impeccable playlists",
-        ],
-    },
+import mmap
+import sys
+from collections import defaultdict
+from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+
+# The guide and taxonomy data live in resources.json next to this module so
+# editing them needs no code change. The file is mmap'd read-only and parsed
+# in one pass; with a preloading server the mapped pages are shared by workers.
+_ASSET_PATH = Path(__file__).with_name("resources.json")
+
+
+def _load_asset(path: Path) -> dict:
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return orjson.loads(memoryview(mm))
+
+
+_ASSET = _load_asset(_ASSET_PATH)
+NEIGHBORHOOD_GUIDES = _ASSET["neighborhoods"]
+CATEGORY_TAXONOMY = _ASSET["categories"]
+del _ASSET
+
+# prestige_range stays a display string in the resource; numeric comparisons
+# use bounds parsed once here instead of split/int on every call
+CATEGORY_BOUNDS = {
+    slug: tuple(int(bound) for bound in category["prestige_range"].split("-"))
+    for slug, category in CATEGORY_TAXONOMY.items()
 }
 
-RESOURCE_MAP = {
-    "nyc-poi://guides/neighborhoods": {
+
+def prestige_bounds(category: str) -> tuple[int, int] | None:
+    """(min, max) prestige score for a category slug, or None if unknown."""
+    return CATEGORY_BOUNDS.get(category)
+
+
+def _invert(entries, key: str) -> dict[str, tuple[str, ...]]:
+    """Map each value of entry[key] to the slugs of the entries that list it."""
+    index = defaultdict(list)
+    for slug, entry in entries:
+        for value in entry[key]:
+            index[value].append(slug)
+    return {value: tuple(slugs) for value, slugs in index.items()}
+
+
+# Occasion lookups are answered from indexes built once at import instead of
+# scanning every guide's best_for list on each recommendation
+GUIDES_BY_SLUG = {guide["slug"]: guide for guide in NEIGHBORHOOD_GUIDES}
+GUIDES_BY_OCCASION = _invert(GUIDES_BY_SLUG.items(), "best_for")
+CATEGORIES_BY_OCCASION = _invert(CATEGORY_TAXONOMY.items(), "ideal_occasions")
+
+
+# Every occasion the taxonomy knows about, as interned strings: normalizing an
+# inbound argument to the interned copy lets later dict/set lookups hit the
+# identity fast path instead of a full string compare
+ALL_OCCASIONS = frozenset(sys.intern(occasion) for occasion in (*GUIDES_BY_OCCASION, *CATEGORIES_BY_OCCASION))
+_INTERNED_OCCASIONS = {occasion: occasion for occasion in ALL_OCCASIONS}
+
+
+def normalize_occasion(occasion: str | None) -> str | None:
+    """Return the interned copy of a known occasion (unknown values pass through)."""
+    return _INTERNED_OCCASIONS.get(occasion, occasion) if occasion else occasion
+
+
+def guides_for_occasion(occasion: str | None) -> tuple[dict, ...]:
+    """Neighborhood guides recommended for an occasion (empty if none)."""
+    return tuple(GUIDES_BY_SLUG[slug] for slug in GUIDES_BY_OCCASION.get(occasion, ()))
+
+
+def categories_for_occasion(occasion: str | None) -> tuple[str, ...]:
+    """Category slugs whose taxonomy lists the occasion as ideal."""
+    return CATEGORIES_BY_OCCASION.get(occasion, ())
+
+
+RESOURCE_MAP = MappingProxyType({
+    "nyc-poi://guides/neighborhoods": MappingProxyType({
         "name": "Neighborhood Playbook",
         "description": "Context cards for the neighborhoods we cover during demos.",
         "mime_type": "application/json",
         "data": {"neighborhoods": NEIGHBORHOOD_GUIDES},
-    },
-    "nyc-poi://taxonomy/categories": {
+    }),
+    "nyc-poi://taxonomy/categories": MappingProxyType({
         "name": "Category Taxonomy",
         "description": "Prestige-focused taxonomy aligning fine dining, casual dining, and cocktail bars.",
         "mime_type": "application/json",
         "data": {"categories": CATEGORY_TAXONOMY},
-    },
-}
+    }),
+})
+
+# The resource data never changes, so each body is serialized once at import
+# and every read hands back the same buffer instead of re-encoding the dicts
+_SERIALIZED = MappingProxyType({
+    uri: orjson.dumps(entry["data"], option=orjson.OPT_INDENT_2)
+    for uri, entry in RESOURCE_MAP.items()
+})
+_SERIALIZED_TEXT = MappingProxyType({uri: body.decode() for uri, body in _SERIALIZED.items()})
+
+
+def get_resource_bytes(uri: str) -> bytes:
+    """Pre-serialized JSON body for a resource URI (raises KeyError if unknown)."""
+    return _SERIALIZED[uri]
+
+
+def get_resource_text(uri: str) -> str:
+    """Pre-serialized JSON body for a resource URI, decoded once for text transports."""
+    return _SERIALIZED_TEXT[uri]
@@ -4,74 +4,108 @@ Model Context Protocol server with restaurant recommendation tools
 """
 
 import asyncio
-import json
 import os
+import re
+import sys
+import time
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+from bson.binary import Binary, BinaryVectorDtype
+from cachetools import LRUCache
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
+import orjson
 
-# Import our utilities
-import sys
-
-sys.path.append(str(Path(__file__).parent))
-
-from config import config
-from resources import RESOURCE_MAP
-from utils.mongodb import MongoDBClient
-from utils.scoring import (
-    combine_score_components,
-    contextual_boost_expression,
+from .config import config
+from .resources import RESOURCE_MAP, get_resource_text, guides_for_occasion, normalize_occasion
+from .render_poi import render_context_result, render_query_result, render_vibe_result
+from .utils.cache import ResponseCache, make_key
+from .utils.mongodb import AsyncMongoDBClient
+from .utils.scoring import (
+    TIME_OF_DAY_BY_HOUR,
+    composite_score_expression,
+    context_reasons_expression,
     hybrid_score_expression,
+    recommendation_reasons_expression,
 )
-from utils.tavily_enrichment import enrich_poi_live
+from .utils.singleflight import single
+from .utils.tavily_enrichment import TavilyEnricher, format_enrichment
 
 # OpenAI for semantic search
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 
 # Initialize server
 server = Server("nyc-poi-concierge")
 
 # Global MongoDB client
-mongo_client: Optional[MongoDBClient] = None
+mongo_client: Optional[AsyncMongoDBClient] = None
 
 # Global OpenAI client for semantic search
-openai_client: Optional[OpenAI] = None
+openai_client: Optional[AsyncOpenAI] = None
+# Vibe query embeddings by normalized wording, so rephrasings like
+# "A romantic dinner" and "romantic dinner" cost one OpenAI call
+_vibe_vectors: LRUCache = LRUCache(maxsize=1024)
+
+# Caps on concurrent calls to the rate-limited APIs
+_openai_limit = asyncio.Semaphore(config.mcp.max_concurrent_openai)
+_tavily_limit = asyncio.Semaphore(config.mcp.max_concurrent_tavily)
+
+# Agents often repeat a search with the same (or nearly the same) arguments;
+# those calls are answered from cache instead of re-running the aggregation
+tool_cache = ResponseCache(
+    redis_url=config.cache.redis_url,
+    default_ttl=config.cache.default_ttl_s,
+    swr_window=config.cache.swr_window_s,
+    maxsize=config.cache.l1_maxsize,
+)
+
+# Live enrichment calls Tavily six times per POI; its results are reused for
+# hours (across restarts too when Redis is configured)
+enrichment_cache = ResponseCache(
+    redis_url=config.cache.redis_url,
+    default_ttl=config.cache.enrichment_ttl_s,
+    maxsize=config.cache.l1_maxsize,
+    namespace="nyc-poi-enrichment",
+)
+
+
+# The resource and tool catalogs are static, so their MCP objects are built
+# once at import instead of on every list/read request
+_RESOURCE_LIST = [
+    types.Resource(
+        uri=uri,
+        name=payload["name"],
+        description=payload["description"],
+        mimeType=payload["mime_type"],
+    )
+    for uri, payload in RESOURCE_MAP.items()
+]
+_RESOURCE_CONTENTS = {
+    uri: types.TextContent(type="text", text=get_resource_text(uri))
+    for uri in RESOURCE_MAP
+}
 
 
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """Expose static neighborhood guides and taxonomy resources."""
-    resources = []
-    for uri, payload in RESOURCE_MAP.items():
-        resources.append(
-            types.Resource(
-                uri=uri,
-                name=payload["name"],
-                description=payload["description"],
-                mimeType=payload["mime_type"],
-            )
-        )
-    return resources
+    return _RESOURCE_LIST
 
 
 @server.read_resource()
 async def handle_read_resource(uri: str) -> list[types.TextContent]:
-    payload = RESOURCE_MAP.get(uri)
-    if not payload:
+    content = _RESOURCE_CONTENTS.get(str(uri))
+    if content is None:
         raise ValueError(f"Unknown resource URI: {uri}")
-    body = json.dumps(payload["data"], indent=2)
-    return [types.TextContent(type="text", text=body)]
+    return [content]
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available MCP tools"""
+def _build_tools() -> list[types.Tool]:
     return [
         types.Tool(
             name="query_pois",
@@ -203,6 +237,82 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["latitude", "longitude"],
             },
         ),
+        types.Tool(
+            name="explore_nearby",
+            description="""Run query_pois and get_contextual_recommendations for one location in a single call.
+            
+            Returns the prestige-ranked nearby list followed by the context-aware picks,
+            computed from one shared geospatial scan. Use it instead of calling both tools
+            back to back for the same spot.
+            """,
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "latitude": {
+                        "type": "number",
+                        "description": "User's latitude (-90 to 90)",
+                    },
+                    "longitude": {
+                        "type": "number",
+                        "description": "User's longitude (-180 to 180)",
+                    },
+                    "radius_meters": {
+                        "type": "number",
+                        "description": "Search radius in meters for both rankings (default: 2000)",
+                        "default": 2000,
+                    },
+                    "categories": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Filter the nearby list by categories: fine-dining, casual-dining, bars-cocktails",
+                    },
+                    "min_prestige_score": {
+                        "type": "number",
+                        "description": "Minimum prestige score for the nearby list (0-150, default: 0)",
+                        "default": 0,
+                    },
+                    "michelin_stars": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "Filter the nearby list by Michelin stars: [1], [2], [3], or [1,2,3]",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of nearby results (default: 10)",
+                        "default": 10,
+                    },
+                    "recommendations_limit": {
+                        "type": "integer",
+                        "description": "Maximum number of recommendations (default: 5)",
+                        "default": 5,
+                    },
+                    "datetime": {
+                        "type": "string",
+                        "description": "ISO 8601 datetime (e.g., '2025-11-22T19:00:00'). Defaults to now.",
+                    },
+                    "weather": {
+                        "type": "string",
+                        "description": "Current weather: sunny, rain, cold, snow, any",
+                        "enum": ["sunny", "rain", "cold", "snow", "any"],
+                    },
+                    "occasion": {
+                        "type": "string",
+                        "description": "Type of occasion (e.g., date-night, celebration)",
+                    },
+                    "group_size": {
+                        "type": "integer",
+                        "description": "Number of people (default: 2)",
+                        "default": 2,
+                    },
+                    "budget": {
+                        "type": "string",
+                        "description": "Budget level",
+                        "enum": ["$", "$$", "$$$", "$$$$", "any"],
+                    },
+                },
+                "required": ["latitude", "longitude"],
+            },
+        ),
         types.Tool(
             name="enrich_poi_live",
             description="""Get real-time enrichment for a specific POI using Tavily trusted source validation.
@@ -235,10 +345,57 @@ async def handle_list_tools() -> list[types.Tool]:
                         "description": "Type of POI: restaurant, bar, cafe, etc.",
                         "default": "restaurant",
                     },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Skip the cached enrichment (kept for a few hours) and query Tavily again",
+                        "default": False,
+                    },
                 },
                 "required": ["poi_name", "poi_address"],
             },
         ),
+        types.Tool(
+            name="enrich_poi_live_batch",
+            description="""Run enrich_poi_live for several POIs in one call (e.g. the top picks from query_pois).
+            
+            The Tavily lookups run concurrently, so enriching five POIs takes about as long as one.
+            Returns one enrichment block per POI, in the order given.
+            """,
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "pois": {
+                        "type": "array",
+                        "description": "POIs to enrich",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "poi_name": {
+                                    "type": "string",
+                                    "description": "Name of the POI to enrich (e.g., 'Le Bernardin')",
+                                },
+                                "poi_address": {
+                                    "type": "string",
+                                    "description": "Street address for specificity (e.g., '155 W 51st St')",
+                                },
+                                "category": {
+                                    "type": "string",
+                                    "description": "Type of POI: restaurant, bar, cafe, etc.",
+                                    "default": "restaurant",
+                                },
+                                "force_refresh": {
+                                    "type": "boolean",
+                                    "description": "Skip the cached enrichment and query Tavily again",
+                                    "default": False,
+                                },
+                            },
+                            "required": ["poi_name", "poi_address"],
+                        },
+                    },
+                },
+                "required": ["pois"],
+            },
+        ),
         types.Tool(
             name="search_by_vibe",
             description="""Search for POIs using natural language vibe descriptions with semantic search.
@@ -279,6 +436,19 @@ async def handle_list_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Optional category filter: fine-dining, casual-dining, bars-cocktails",
                     },
+                    "latitude": {
+                        "type": "number",
+                        "description": "Optional latitude; with longitude, only matches within radius_meters are returned",
+                    },
+                    "longitude": {
+                        "type": "number",
+                        "description": "Optional longitude (used with latitude)",
+                    },
+                    "radius_meters": {
+                        "type": "integer",
+                        "description": "Search radius around latitude/longitude in meters (default: 2000)",
+                        "default": 2000,
+                    },
                 },
                 "required": ["vibe_query"],
             },
@@ -286,6 +456,15 @@ async def handle_list_tools() -> list[types.Tool]:
     ]
 
 
+_TOOLS_LIST = _build_tools()
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available MCP tools"""
+    return _TOOLS_LIST
+
+
 @server.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
@@ -296,19 +475,204 @@ async def handle_call_tool(
         raise RuntimeError("MongoDB client not initialized")
     
     if name == "query_pois":
-        return await query_pois_tool(arguments or {})
+        return await _cached_tool(name, query_pois_tool, arguments or {})
     elif name == "get_contextual_recommendations":
         return await contextual_recommendations_tool(arguments or {})
+    elif name == "explore_nearby":
+        return await explore_nearby_tool(arguments or {})
     elif name == "enrich_poi_live":
         return await enrich_poi_live_tool(arguments or {})
+    elif name == "enrich_poi_live_batch":
+        return await enrich_poi_live_batch_tool(arguments or {})
     elif name == "search_by_vibe":
         return await search_by_vibe_tool(arguments or {})
     else:
         raise ValueError(f"Unknown tool: {name}")
 
 
-async def query_pois_tool(args: Dict[str, Any]) -> list[types.TextContent]:
-    """Execute POI query with filters"""
+# Only the fields each formatter renders leave MongoDB (signature dishes are
+# trimmed to the two shown), instead of whole POI documents. Nested fields
+# are lifted to top-level names so formatters read a flat record; a field
+# missing from the POI is missing here too, and .get() supplies the default.
+_QUERY_POIS_PROJECTION = {"$project": {
+    "_id": 0,
+    "name": 1,
+    "street": "$address.street",
+    "neighborhood": "$address.neighborhood",
+    "distance": 1,
+    "prestige_score": "$prestige.score",
+    "stars": "$prestige.michelin_stars",
+    "price_range": "$experience.price_range",
+    "signature_dishes": {"$slice": ["$experience.signature_dishes", 2]},
+    "phone": "$contact.phone",
+    "context_reasons": 1,
+    "hybrid_score": 1,
+    "composite_score": 1,
+}}
+_RECOMMENDATIONS_PROJECTION = {"$project": {
+    "_id": 1,  # matched against vibe results when fusing rankings
+    "name": 1,
+    "neighborhood": "$address.neighborhood",
+    "distance": 1,
+    "prestige_score": "$prestige.score",
+    "stars": "$prestige.michelin_stars",
+    "price_range": "$experience.price_range",
+    "phone": "$contact.phone",
+    "context_reasons": 1,
+    "relevance_score": 1,
+}}
+
+
+def _sort_token(value: Any) -> bytes:
+    return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS)
+
+
+def _cache_key(name: str, args: Dict[str, Any]) -> str:
+    """
+    Cache key over canonicalized arguments: coordinates are rounded to 3
+    decimals (~100m) so nearby searches share an entry, and list filters
+    are sorted so their order doesn't matter. List items are ordered by
+    their JSON encoding, so mixed types and dicts sort without a TypeError.
+    """
+    canonical = {}
+    for key, value in args.items():
+        if key in ("latitude", "longitude") and isinstance(value, (int, float)):
+            value = round(value, 3)
+        elif isinstance(value, list):
+            value = sorted(value, key=_sort_token)
+        canonical[key] = value
+    return make_key(name, canonical)
+
+
+async def _cached_tool(
+    name: str, tool, args: Dict[str, Any], ttl: Optional[int] = None
+) -> list[types.TextContent]:
+    """Run a tool through tool_cache (only the response texts are stored)"""
+    async def compute():
+        return [content.text for content in await tool(args)]
+    
+    texts = await tool_cache.get_or_compute(_cache_key(name, args), compute, ttl)
+    return [types.TextContent(type="text", text=text) for text in texts]
+
+
+async def _cached_results(name: str, args: Dict[str, Any], ctx: Dict[str, Any], fetch, ttl: Optional[int] = None):
+    """
+    Run a recommendations aggregation through tool_cache. The stored value
+    is the ranked POIs, not the response text: the header echoes the
+    caller's exact coordinates and time, so it's rendered per call. Without
+    a datetime argument the ranking depends on the current time of day, so
+    that bucket is part of the key.
+    """
+    return await tool_cache.get_or_compute(
+        _cache_key(name, {**args, "time_of_day": ctx["time_of_day"]}), fetch, ttl
+    )
+
+
+# Popular neighborhoods (lat, lon at the cache key's 3-decimal precision) and
+# the searches agents most often run there; warm_cache() pre-loads their
+# responses into tool_cache
+_WARM_LOCATIONS = (
+    (40.758, -73.985),  # Midtown / Times Square
+    (40.741, -73.990),  # Flatiron & NoMad
+    (40.734, -74.003),  # West Village
+    (40.723, -74.003),  # SoHo
+    (40.727, -73.982),  # East Village
+    (40.715, -73.984),  # Lower East Side
+    (40.708, -74.011),  # Financial District
+    (40.787, -73.975),  # Upper West Side
+    (40.774, -73.957),  # Upper East Side
+    (40.708, -73.957),  # Williamsburg
+)
+_WARM_SEARCHES = (
+    ("query_pois", {}),
+    ("query_pois", {"occasion": "date-night"}),
+    ("get_contextual_recommendations", {}),
+    ("get_contextual_recommendations", {"occasion": "date-night"}),
+    ("get_contextual_recommendations", {"occasion": "business-dinner"}),
+)
+_warm_task: Optional[asyncio.Task] = None
+
+
+async def warm_cache():
+    """
+    Run the popular searches through tool_cache once, storing them for
+    CACHE_WARM_TTL_S rather than the usual TTL so first requests for them
+    stay cache hits long after startup. Contextual entries are keyed on the
+    startup time-of-day bucket, so they only answer calls in that bucket.
+    Once an entry goes stale, agents' hits refresh it in the background at
+    the normal TTL; an idle server makes no further MongoDB or OpenAI calls.
+    """
+    ttl = config.cache.warm_ttl_s
+    tools = {
+        "query_pois": lambda args: _cached_tool("query_pois", query_pois_tool, args, ttl),
+        "get_contextual_recommendations": lambda args: contextual_recommendations_tool(args, ttl),
+    }
+    failures = 0
+    for lat, lon in _WARM_LOCATIONS:
+        for name, extra in _WARM_SEARCHES:
+            try:
+                await tools[name]({"latitude": lat, "longitude": lon, **extra})
+            except Exception:
+                failures += 1
+    if failures:
+        print(f"⚠️  Cache warm-up: {failures} search(es) failed", file=sys.stderr)
+
+
+def start_cache_warmer():
+    """Start warm_cache() in the background (once per process, only with CACHE_WARM_ON_START)"""
+    global _warm_task
+    if config.cache.warm_on_start and _warm_task is None:
+        _warm_task = asyncio.create_task(warm_cache())
+
+
+async def _aggregate(pipeline: list[dict], limit: int) -> List[Dict[str, Any]]:
+    """
+    Run a pipeline whose output is capped at `limit` documents. The cursor
+    batch size matches the limit, so results arrive in the first reply
+    instead of a default-sized batch plus getMore round-trips.
+    """
+    cursor = mongo_client.pois.aggregate(pipeline, allowDiskUse=False).batch_size(limit)
+    return await cursor.to_list(length=limit)
+
+
+@lru_cache(maxsize=4096)
+def _geo_near_stage(lat: float, lon: float, radius: int) -> dict:
+    """
+    Shared, read-only $geoNear stage. Callers round coordinates to 4 decimals
+    (~10m) so bursts of searches from one spot reuse the same stage.
+    """
+    return {
+        "$geoNear": {
+            "near": {
+                "type": "Point",
+                "coordinates": [lon, lat]
+            },
+            "distanceField": "distance",
+            "maxDistance": radius,
+            "spherical": True
+        }
+    }
+
+
+def _filtered_geo_near_stage(lat: float, lon: float, radius: int, query: Dict[str, Any]) -> dict:
+    """
+    $geoNear stage with the tool's filters in its `query`, so they're applied
+    while walking the 2dsphere index instead of by a $match over every nearby POI
+    """
+    stage = _geo_near_stage(round(lat, 4), round(lon, 4), radius)
+    if not query:
+        return stage
+    return {"$geoNear": {**stage["$geoNear"], "query": query}}
+
+
+def _facet_branch(pipeline: list[dict]) -> list[dict]:
+    """A plan's stages after $geoNear, with its $geoNear filters as a leading $match"""
+    query = pipeline[0]["$geoNear"].get("query")
+    return ([{"$match": query}] if query else []) + pipeline[1:]
+
+
+def _query_pois_plan(args: Dict[str, Any]) -> tuple[list[dict], Dict[str, Any]]:
+    """Aggregation pipeline for query_pois (starting with $geoNear) plus what its formatter needs"""
     
     lat = args["latitude"]
     lon = args["longitude"]
@@ -317,27 +681,16 @@ async def query_pois_tool(args: Dict[str, Any]) -> list[types.TextContent]:
     min_prestige = args.get("min_prestige_score", 0)
     michelin_stars = args.get("michelin_stars")
     limit = args.get("limit", 10)
-    occasion = args.get("occasion")
+    occasion = normalize_occasion(args.get("occasion"))
     time_of_day = args.get("time_of_day")
     weather_condition = args.get("weather_condition")
     
-    # Build MongoDB aggregation pipeline
-    pipeline = [
-        {
-            "$geoNear": {
-                "near": {
-                    "type": "Point",
-                    "coordinates": [lon, lat]
-                },
-                "distanceField": "distance",
-                "maxDistance": radius,
-                "spherical": True
-            }
-        }
-    ]
+    # Filters (a $gte 0 prestige check passes every scored POI, so the
+    # default call leaves it out)
+    match_conditions = {}
     
-    # Add filters
-    match_conditions = {"prestige.score": {"$gte": min_prestige}}
+    if min_prestige > 0:
+        match_conditions["prestige.score"] = {"$gte": min_prestige}
     
     if categories:
         match_conditions["category"] = {"$in": categories}
@@ -345,111 +698,155 @@ async def query_pois_tool(args: Dict[str, Any]) -> list[types.TextContent]:
     if michelin_stars:
         match_conditions["prestige.michelin_stars"] = {"$in": michelin_stars}
     
-    if match_conditions:
-        pipeline.append({"$match": match_conditions})
+    # Build MongoDB aggregation pipeline
+    pipeline = [_filtered_geo_near_stage(lat, lon, radius, match_conditions)]
+    
+    if not (occasion or time_of_day or weather_condition):
+        # Without context the boost is a constant 0 and composite_score would
+        # just repeat hybrid_score, so rank on hybrid_score alone
+        hybrid_expr = hybrid_score_expression(
+            radius_meters=radius,
+            categories=categories,
+        )
+        pipeline.extend([
+            {"$addFields": {"hybrid_score": hybrid_expr}},
+            {"$sort": {"hybrid_score": -1}},
+            {"$limit": limit},
+            _QUERY_POIS_PROJECTION,
+        ])
+        return pipeline, {"radius": radius, "limit": limit, "score_field": "hybrid_score"}
     
-    hybrid_expr = hybrid_score_expression(
-        radius_meters=radius,
+    # The formatter only shows the combined score, so hybrid and contextual
+    # parts are folded into one expression rather than stored as fields
+    composite_expr = composite_score_expression(
+        radius,
         categories=categories,
-    )
-    context_expr = contextual_boost_expression(
         occasion=occasion,
         time_of_day=time_of_day,
         weather=weather_condition,
     )
-    composite_expr = combine_score_components(hybrid_expr, context_expr)
+    pipeline.append({"$addFields": {"composite_score": composite_expr}})
     
-    pipeline.append({
-        "$addFields": {
-            "hybrid_score": hybrid_expr,
-            "contextual_score": context_expr,
-            "composite_score": composite_expr,
-        }
-    })
+    reasons_expr = context_reasons_expression(
+        occasion=occasion,
+        time_of_day=time_of_day,
+        weather=weather_condition,
+    )
     
     pipeline.extend([
         {"$sort": {"composite_score": -1}},
         {"$limit": limit},
+        {"$addFields": {"context_reasons": reasons_expr}},
+        _QUERY_POIS_PROJECTION,
     ])
     
-    # Execute query
-    results = list(mongo_client.pois.aggregate(pipeline))
-    
-    # Format results
+    return pipeline, {"radius": radius, "limit": limit, "score_field": "composite_score"}
+
+
+def _format_query_pois(results: List[Dict[str, Any]], ctx: Dict[str, Any]) -> str:
     if not results:
-        return [types.TextContent(
-            type="text",
-            text="No POIs found matching your criteria. Try increasing the search radius or adjusting filters."
-        )]
+        return "No POIs found matching your criteria. Try increasing the search radius or adjusting filters."
     
     # Build response
-    response_text = f"Found {len(results)} POI(s) within {radius}m:\n\n"
-    
-    for i, poi in enumerate(results, 1):
-        stars = poi.get("prestige", {}).get("michelin_stars")
-        stars_str = f" {'⭐' * stars}" if stars else ""
-        score = poi.get("composite_score") or poi.get("hybrid_score")
-        context_reasons = []
-        if occasion and occasion in poi.get("best_for", {}).get("occasions", []):
-            context_reasons.append(occasion.replace("-", " "))
-        if time_of_day and time_of_day in poi.get("best_for", {}).get("time_of_day", []):
-            context_reasons.append(time_of_day)
-        if weather_condition and weather_condition in poi.get("best_for", {}).get("weather", []):
-            context_reasons.append(f"{weather_condition} friendly")
-        
-        response_text += f"{i}. **{poi['name']}**{stars_str}\n"
-        response_text += f"   📍 {poi.get('address', {}).get('street', 'N/A')}, {poi.get('address', {}).get('neighborhood', '')}\n"
-        response_text += f"   📏 Distance: {poi.get('distance', 0):.0f}m\n"
-        response_text += f"   ⭐ Prestige Score: {poi.get('prestige', {}).get('score', 0)}\n"
-        if score:
-            response_text += f"   ⚖️ Hybrid Score: {score:.1f}\n"
-        response_text += f"   💰 Price: {poi.get('experience', {}).get('price_range', 'N/A')}\n"
-        response_text += f"   📞 {poi.get('contact', {}).get('phone', 'N/A')}\n"
-        if context_reasons:
-            response_text += f"   🎯 Context fit: {', '.join(context_reasons)}\n"
-        
-        if poi.get('experience', {}).get('signature_dishes'):
-            dishes = poi['experience']['signature_dishes'][:2]
-            response_text += f"   🍽️  Signature: {', '.join(dishes)}\n"
-        
-        response_text += "\n"
+    parts = [f"Found {len(results)} POI(s) within {ctx['radius']}m:\n\n"]
+    
+    score_field = ctx["score_field"]
+    parts.extend(render_query_result(i, poi, score_field) for i, poi in enumerate(results, 1))
     
-    return [types.TextContent(type="text", text=response_text)]
+    return "".join(parts)
+
 
+_MICHELIN_STAR_LEVELS = frozenset({1, 2, 3})
+_MAX_PRESTIGE_SCORE = 150
 
-async def contextual_recommendations_tool(args: Dict[str, Any]) -> list[types.TextContent]:
-    """Execute context-aware recommendations"""
+
+def _trivial_query_response(args: Dict[str, Any], default_radius: int) -> Optional[str]:
+    """
+    Response for arguments that are malformed or can't match any POI, so
+    the tool answers without a MongoDB round-trip. None means run the query.
+    """
+    lat = args["latitude"]
+    lon = args["longitude"]
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return (
+            f"Invalid coordinates ({lat}, {lon}): latitude must be between -90 and 90 "
+            "and longitude between -180 and 180."
+        )
+    if args.get("radius_meters", default_radius) <= 0:
+        return "Invalid radius_meters: the search radius must be greater than 0."
+    
+    michelin_stars = args.get("michelin_stars") or []
+    if any(stars not in _MICHELIN_STAR_LEVELS for stars in michelin_stars):
+        return "Invalid michelin_stars: Michelin stars are 1, 2 or 3."
+    if args.get("min_prestige_score", 0) > _MAX_PRESTIGE_SCORE:
+        return f"No POIs found: prestige scores top out at {_MAX_PRESTIGE_SCORE}."
+    return None
+
+
+async def query_pois_tool(args: Dict[str, Any]) -> list[types.TextContent]:
+    """Execute POI query with filters"""
+    if trivial := _trivial_query_response(args, 2000):
+        return [types.TextContent(type="text", text=trivial)]
+    
+    pipeline, ctx = _query_pois_plan(args)
+    
+    # Execute query (awaited, so other tool calls run during the round-trip)
+    results = await _aggregate(pipeline, ctx["limit"])
+    
+    return [types.TextContent(type="text", text=_format_query_pois(results, ctx))]
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime(datetime_str: str) -> datetime:
+    return datetime.fromisoformat(datetime_str).replace(second=0, microsecond=0)
+
+
+_WHEN_FORMAT = '%A, %B %d at %I:%M %p'
+
+
+@lru_cache(maxsize=1024)
+def _format_when(dt: datetime) -> str:
+    return dt.strftime(_WHEN_FORMAT)
+
+
+@lru_cache(maxsize=1024)
+def _format_local_when(local_minute: tuple) -> str:
+    return time.strftime(_WHEN_FORMAT, local_minute)
+
+
+@lru_cache(maxsize=32)
+def _occasion_title(occasion: str) -> str:
+    return occasion.replace('-', ' ').title()
+
+
+def _recommendations_plan(args: Dict[str, Any]) -> tuple[list[dict], Dict[str, Any]]:
+    """Aggregation pipeline for contextual recommendations plus what its formatter needs"""
     
     lat = args["latitude"]
     lon = args["longitude"]
     radius = args.get("radius_meters", 3000)
     datetime_str = args.get("datetime")
     weather = args.get("weather", "any")
-    occasion = args.get("occasion")
+    occasion = normalize_occasion(args.get("occasion"))
     group_size = args.get("group_size", 2)
     budget = args.get("budget")
     limit = args.get("limit", 5)
     
-    # Parse datetime
+    # Parse datetime (minute precision is all the response shows, and it
+    # lets repeated timestamps share the cached parse/format results). The
+    # usual no-datetime call only needs the local hour now; its time tuple
+    # (seconds zeroed) is formatted when the response is built
     if datetime_str:
-        dt = datetime.fromisoformat(datetime_str)
+        dt = _parse_datetime(datetime_str)
+        hour = dt.hour
+        local_minute = None
     else:
-        dt = datetime.now()
+        now = time.localtime()
+        hour = now.tm_hour
+        dt = None
+        local_minute = now[:5] + (0,) + now[6:]
     
-    hour = dt.hour
-    time_of_day = "lunch" if 11 <= hour < 15 else "dinner" if 17 <= hour < 23 else "any"
-    
-    # Build pipeline
-    pipeline = [
-        {
-            "$geoNear": {
-                "near": {"type": "Point", "coordinates": [lon, lat]},
-                "distanceField": "distance",
-                "maxDistance": radius,
-                "spherical": True
-            }
-        }
-    ]
+    time_of_day = TIME_OF_DAY_BY_HOUR[hour]
     
     # Build match conditions
     match_conditions: List[Dict[str, Any]] = []
@@ -463,88 +860,182 @@ async def contextual_recommendations_tool(args: Dict[str, Any]) -> list[types.Te
             ]
         })
     
-    if match_conditions:
-        pipeline.append({"$match": {"$and": match_conditions}})
+    # Build pipeline (filters ride along in $geoNear.query)
+    pipeline = [_filtered_geo_near_stage(
+        lat, lon, radius, {"$and": match_conditions} if match_conditions else {}
+    )]
     
-    hybrid_expr = hybrid_score_expression(radius_meters=radius)
-    context_expr = contextual_boost_expression(
+    relevance_expr = composite_score_expression(
+        radius,
         occasion=occasion,
         time_of_day=time_of_day if time_of_day != "any" else None,
         weather=weather,
         group_size=group_size,
         budget=budget,
     )
-    relevance_expr = combine_score_components(hybrid_expr, context_expr)
+    pipeline.append({"$addFields": {"relevance_score": relevance_expr}})
     
-    pipeline.append({
-        "$addFields": {
-            "hybrid_score": hybrid_expr,
-            "contextual_score": context_expr,
-            "relevance_score": relevance_expr
-        }
-    })
+    reasons_expr = recommendation_reasons_expression(
+        occasion=occasion,
+        time_of_day=time_of_day,
+        weather=weather,
+        budget=budget,
+    )
     
     pipeline.extend([
         {"$sort": {"relevance_score": -1}},
-        {"$limit": limit}
+        {"$limit": limit},
+        {"$addFields": {"context_reasons": reasons_expr}},
+        _RECOMMENDATIONS_PROJECTION,
     ])
     
-    # Execute
-    results = list(mongo_client.pois.aggregate(pipeline))
+    ctx = {
+        "lat": lat,
+        "lon": lon,
+        "dt": dt,
+        "local_minute": local_minute,
+        "time_of_day": time_of_day,
+        "weather": weather,
+        "occasion": occasion,
+        "group_size": group_size,
+        "budget": budget,
+        "limit": limit,
+    }
+    return pipeline, ctx
+
+
+def _format_recommendations(results: List[Dict[str, Any]], ctx: Dict[str, Any]) -> str:
+    occasion = ctx["occasion"]
+    weather = ctx["weather"]
+    group_size = ctx["group_size"]
+    budget = ctx["budget"]
     
     if not results:
-        return [types.TextContent(
-            type="text",
-            text=f"No recommendations found for {occasion or 'your occasion'} near you. Try adjusting your preferences."
-        )]
+        return f"No recommendations found for {occasion or 'your occasion'} near you. Try adjusting your preferences."
     
     # Build contextual response
-    response_text = f"🎯 **Personalized Recommendations**\n\n"
-    response_text += f"📍 Location: {lat:.4f}, {lon:.4f}\n"
-    response_text += f"🕐 Time: {dt.strftime('%A, %B %d at %I:%M %p')}\n"
+    parts = [f"🎯 **Personalized Recommendations**\n\n"]
+    parts.append(f"📍 Location: {ctx['lat']:.4f}, {ctx['lon']:.4f}\n")
+    when = _format_when(ctx["dt"]) if ctx["dt"] else _format_local_when(ctx["local_minute"])
+    parts.append(f"🕐 Time: {when}\n")
     if occasion:
-        response_text += f"🎉 Occasion: {occasion.replace('-', ' ').title()}\n"
+        parts.append(f"🎉 Occasion: {_occasion_title(occasion)}\n")
+        guides = guides_for_occasion(occasion)
+        if guides:
+            parts.append(f"🗺️  Neighborhoods to explore: {', '.join(guide['name'] for guide in guides)}\n")
     if weather and weather != "any":
-        response_text += f"🌤️  Weather: {weather.title()}\n"
-    response_text += f"👥 Party Size: {group_size}\n"
+        parts.append(f"🌤️  Weather: {weather.title()}\n")
+    parts.append(f"👥 Party Size: {group_size}\n")
     if budget and budget != "any":
-        response_text += f"💰 Budget: {budget}\n"
-    response_text += f"\n---\n\n"
+        parts.append(f"💰 Budget: {budget}\n")
+    parts.append(f"\n---\n\n")
     
-    for i, poi in enumerate(results, 1):
-        stars = poi.get("prestige", {}).get("michelin_stars")
-        stars_str = f" {'⭐' * stars}" if stars else ""
-        score = poi.get("relevance_score") or poi.get("hybrid_score")
-        
-        response_text += f"**{i}. {poi['name']}**{stars_str}\n"
-        response_text += f"   {poi.get('address', {}).get('neighborhood', '')} · {poi.get('distance', 0):.0f}m away\n"
-        response_text += f"   💰 {poi.get('experience', {}).get('price_range', 'N/A')} · "
-        response_text += f"Prestige: {poi.get('prestige', {}).get('score', 0)}"
-        if score:
-            response_text += f" · ⚖️ {score:.1f}"
-        response_text += "\n"
-        
-        # Why this recommendation
-        reasons = []
-        if occasion and occasion in poi.get('best_for', {}).get('occasions', []):
-            reasons.append(f"Perfect for {occasion.replace('-', ' ')}")
-        if time_of_day and time_of_day in poi.get('best_for', {}).get('time_of_day', []):
-            reasons.append(time_of_day.title())
-        if weather and weather != "any" and weather in poi.get('best_for', {}).get('weather', []):
-            reasons.append(f"{weather} friendly")
-        if budget and budget == poi.get('experience', {}).get('price_range'):
-            reasons.append("Budget match")
-        if stars:
-            reasons.append(f"{stars}-Michelin-star")
-        if poi.get('distance', 0) < 1000:
-            reasons.append("Very close")
-        
-        if reasons:
-            response_text += f"   ✨ {' · '.join(reasons)}\n"
-        
-        response_text += f"   📞 {poi.get('contact', {}).get('phone', 'N/A')}\n\n"
+    parts.extend(
+        render_context_result(i, poi)
+        for i, poi in enumerate(results, 1)
+    )
     
-    return [types.TextContent(type="text", text=response_text)]
+    return "".join(parts)
+
+
+async def contextual_recommendations_tool(
+    args: Dict[str, Any], cache_ttl: Optional[int] = None
+) -> list[types.TextContent]:
+    """Execute context-aware recommendations (`cache_ttl` overrides the cached results' TTL)"""
+    if trivial := _trivial_query_response(args, 3000):
+        return [types.TextContent(type="text", text=trivial)]
+    
+    pipeline, ctx = _recommendations_plan(args)
+    
+    async def fetch():
+        if ctx["occasion"] and openai_client:
+            return await _recommendations_with_vibe(args, ctx)
+        return await _aggregate(pipeline, ctx["limit"])
+    
+    results = await _cached_results("get_contextual_recommendations", args, ctx, fetch, cache_ttl)
+    return [types.TextContent(type="text", text=_format_recommendations(results, ctx))]
+
+
+# Candidates per result that each ranking contributes to the fusion
+_FUSION_POOL = 3
+# Reciprocal-rank fusion damping constant (the usual 60)
+_RRF_K = 60
+
+
+async def _recommendations_with_vibe(args: Dict[str, Any], ctx: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Contextual recommendations re-ranked with a semantic match on the
+    occasion: the geo ranking and a nearby vector search for the occasion
+    run concurrently and are merged by reciprocal-rank fusion. The vibe
+    side is best-effort; if it fails the geo ranking stands alone.
+    """
+    limit = ctx["limit"]
+    pool = limit * _FUSION_POOL
+    geo_pipeline, _ = _recommendations_plan({**args, "limit": pool})
+    
+    async def vibe_ids() -> list:
+        query_vector = await _vibe_query_vector(ctx["occasion"].replace("-", " "))
+        near = (ctx["lat"], ctx["lon"], args.get("radius_meters", 3000))
+        pipeline = _vector_search_stages(query_vector, pool, near=near) + [{"$project": {"_id": 1}}]
+        return [doc["_id"] for doc in await _aggregate(pipeline, pool)]
+    
+    geo, vibe = await asyncio.gather(_aggregate(geo_pipeline, pool), vibe_ids(), return_exceptions=True)
+    if isinstance(geo, BaseException):
+        raise geo
+    if isinstance(vibe, BaseException):
+        return geo[:limit]
+    
+    vibe_rank = {poi_id: rank for rank, poi_id in enumerate(vibe, 1)}
+    
+    def fused_score(ranked: tuple) -> float:
+        rank, poi = ranked
+        score = 1 / (_RRF_K + rank)
+        if poi["_id"] in vibe_rank:
+            score += 1 / (_RRF_K + vibe_rank[poi["_id"]])
+        return score
+    
+    fused = sorted(enumerate(geo, 1), key=fused_score, reverse=True)
+    return [poi for _, poi in fused[:limit]]
+
+
+async def explore_nearby_tool(args: Dict[str, Any]) -> list[types.TextContent]:
+    """
+    query_pois and contextual recommendations for one location in a single
+    round-trip: the shared $geoNear runs once and $facet ranks its output
+    both ways.
+    """
+    # Both plans see the same coordinates and radius, so one unfiltered
+    # $geoNear feeds both branches and each plan's filters become a $match
+    shared = {"radius_meters": 2000, **args}
+    if trivial := _trivial_query_response(shared, 2000):
+        return [types.TextContent(type="text", text=trivial)]
+    
+    weather = args.get("weather")
+    query_pipeline, query_ctx = _query_pois_plan({
+        **shared,
+        "weather_condition": weather if weather != "any" else None,
+    })
+    rec_pipeline, rec_ctx = _recommendations_plan({**shared, "limit": args.get("recommendations_limit", 5)})
+    
+    pipeline = [
+        _geo_near_stage(round(args["latitude"], 4), round(args["longitude"], 4), shared["radius_meters"]),
+        {"$facet": {"pois": _facet_branch(query_pipeline), "recommendations": _facet_branch(rec_pipeline)}},
+    ]
+    
+    async def fetch():
+        [facets] = await _aggregate(pipeline, 1)
+        return facets
+    
+    facets = await _cached_results("explore_nearby", args, rec_ctx, fetch)
+    
+    text = (
+        _format_query_pois(facets["pois"], query_ctx)
+        + "\n---\n\n"
+        + _format_recommendations(facets["recommendations"], rec_ctx)
+    )
+    return [types.TextContent(type="text", text=text)]
+
+
 
 
 async def enrich_poi_live_tool(args: Dict[str, Any]) -> list[types.TextContent]:
@@ -554,13 +1045,31 @@ async def enrich_poi_live_tool(args: Dict[str, Any]) -> list[types.TextContent]:
     poi_address = args.get("poi_address", "")
     category = args.get("category", "restaurant")
     
+    # Spelling variants of the same name and address share one entry
+    key = make_key("enrich_poi_live", {
+        "name": " ".join(poi_name.lower().split()),
+        "address": " ".join(poi_address.lower().split()),
+        "category": category,
+    })
+    
+    async def compute():
+        async with _tavily_limit:
+            return await TavilyEnricher().enrich_poi(
+                poi_name=poi_name,
+                poi_address=poi_address,
+                category=category
+            )
+    
     try:
-        # Call Tavily enrichment
-        enriched_text = await enrich_poi_live(
-            poi_name=poi_name,
-            poi_address=poi_address,
-            category=category
+        # Call Tavily enrichment (unless cached); a lookup where every Tavily
+        # search failed isn't kept
+        enrichment = await enrichment_cache.get_or_compute(
+            key,
+            compute,
+            refresh=bool(args.get("force_refresh")),
+            cacheable=lambda enrichment: bool(enrichment["citations"]),
         )
+        enriched_text = format_enrichment(poi_name, enrichment)
         
         return [types.TextContent(type="text", text=enriched_text)]
         
@@ -570,6 +1079,87 @@ async def enrich_poi_live_tool(args: Dict[str, Any]) -> list[types.TextContent]:
         return [types.TextContent(type="text", text=error_text)]
 
 
+async def enrich_poi_live_batch_tool(args: Dict[str, Any]) -> list[types.TextContent]:
+    """Enrich several POIs at once; the Tavily lookups run concurrently."""
+    
+    pois = args.get("pois", [])
+    max_batch_size = config.mcp.max_batch_size
+    if len(pois) > max_batch_size:
+        return [types.TextContent(type="text", text=f"❌ At most {max_batch_size} POIs per batch.")]
+    
+    results = await asyncio.gather(*(enrich_poi_live_tool(poi) for poi in pois))
+    return [content for contents in results for content in contents]
+
+
+_VIBE_STOPWORDS = frozenset({
+    "a", "an", "and", "the", "for", "with", "to", "of", "in", "on", "at",
+    "some", "place", "spot", "somewhere", "i", "we", "want", "looking",
+})
+
+
+def _vibe_key(vibe_query: str) -> str:
+    """Lowercased vibe words minus filler, in order (all words if only filler)"""
+    words = re.findall(r"[\w$'-]+", vibe_query.lower())
+    return " ".join(word for word in words if word not in _VIBE_STOPWORDS) or " ".join(words)
+
+
+async def _vibe_query_vector(vibe_query: str) -> Binary:
+    """
+    Embedding for a vibe query as a float32 binData vector (the stored
+    embeddings' format); repeats and concurrent duplicates share one call
+    """
+    key = _vibe_key(vibe_query)
+    vector = _vibe_vectors.get(key)
+    if vector is None:
+        async def embed():
+            async with _openai_limit:
+                response = await openai_client.embeddings.create(
+                    model=config.openai.embedding_model,
+                    input=vibe_query,
+                    dimensions=config.openai.embedding_dimensions
+                )
+            return Binary.from_vector(response.data[0].embedding, BinaryVectorDtype.FLOAT32)
+        
+        vector = _vibe_vectors[key] = await single(f"vibe:{key}", embed)
+    return vector
+
+
+# $centerSphere takes its radius in radians
+_EARTH_RADIUS_METERS = 6378100
+
+
+def _vector_search_stages(
+    query_vector: Binary,
+    limit: int,
+    *,
+    category: Optional[str] = None,
+    near: Optional[tuple] = None,
+) -> list[dict]:
+    """
+    $vectorSearch (plus a $geoWithin $match when `near` is (lat, lon, radius))
+    over-fetching `limit` so later filters still leave enough matches. Category
+    is a pre-filter inside the vector index walk; a location can't be, so
+    nearby searches over-fetch and keep the matches inside the circle.
+    """
+    vector_search = {
+        "index": "vector_index",
+        "path": "embedding",
+        "queryVector": query_vector,
+        "numCandidates": max(150, limit * 20) if near else 150,
+        "limit": limit * 5 if near else limit * 2  # Get more for post-filtering
+    }
+    if category:
+        vector_search["filter"] = {"category": category}
+    
+    stages = [{"$vectorSearch": vector_search}]
+    if near:
+        lat, lon, radius = near
+        stages.append({"$match": {
+            "location": {"$geoWithin": {"$centerSphere": [[lon, lat], radius / _EARTH_RADIUS_METERS]}}
+        }})
+    return stages
+
+
 async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
     """Execute semantic search using MongoDB vector search.
     
@@ -581,6 +1171,9 @@ async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
     limit = args.get("limit", 10)
     min_score = args.get("min_score", 0.7)
     category = args.get("category")
+    lat = args.get("latitude")
+    lon = args.get("longitude")
+    near = lat is not None and lon is not None
     
     if not openai_client:
         return [types.TextContent(
@@ -589,26 +1182,17 @@ async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
         )]
     
     try:
-        # Generate embedding for the vibe query
-        response = openai_client.embeddings.create(
-            model=config.openai.embedding_model,
-            input=vibe_query,
-            dimensions=config.openai.embedding_dimensions
-        )
-        
-        query_vector = response.data[0].embedding
+        # Generate (or reuse) the embedding for the vibe query
+        query_vector = await _vibe_query_vector(vibe_query)
         
         # Build MongoDB vector search aggregation pipeline
-        pipeline = [
-            {
-                "$vectorSearch": {
-                    "index": "vector_index",
-                    "path": "embedding",
-                    "queryVector": query_vector,
-                    "numCandidates": 100,  # Consider top 100 candidates
-                    "limit": limit * 2  # Get more for post-filtering
-                }
-            },
+        pipeline = _vector_search_stages(
+            query_vector,
+            limit,
+            category=category,
+            near=(lat, lon, args.get("radius_meters", 2000)) if near else None,
+        )
+        pipeline.extend([
             {
                 "$addFields": {
                     "similarity_score": {"$meta": "vectorSearchScore"}
@@ -619,27 +1203,24 @@ async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
                     "similarity_score": {"$gte": min_score}
                 }
             }
-        ]
-        
-        # Add category filter if specified
-        if category:
-            pipeline.append({
-                "$match": {"category": category}
-            })
+        ])
         
         # Project fields and limit
         pipeline.extend([
             {
                 "$project": {
+                    "_id": 0,
                     "name": 1,
                     "category": 1,
                     "subcategories": 1,
-                    "address": 1,
-                    "prestige": 1,
-                    "experience": 1,
-                    "contact": 1,
-                    "best_for": 1,
-                    "embedding_text": 1,
+                    "neighborhood": "$address.neighborhood",
+                    "prestige_score": "$prestige.score",
+                    "stars": "$prestige.michelin_stars",
+                    "price_range": "$experience.price_range",
+                    "ambiance": {"$slice": ["$experience.ambiance", 3]},
+                    "signature_dishes": {"$slice": ["$experience.signature_dishes", 2]},
+                    "occasions": {"$slice": ["$best_for.occasions", 2]},
+                    "phone": "$contact.phone",
                     "similarity_score": 1
                 }
             },
@@ -648,7 +1229,7 @@ async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
         ])
         
         # Execute vector search
-        results = list(mongo_client.pois.aggregate(pipeline))
+        results = await _aggregate(pipeline, limit)
         
         if not results:
             return [types.TextContent(
@@ -662,47 +1243,14 @@ async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
             )]
         
         # Build response
-        response_text = f"🔮 **Semantic Search Results**\n\n"
-        response_text += f"🎯 Vibe Query: \"{vibe_query}\"\n"
-        response_text += f"📊 Found {len(results)} match(es) (min score: {min_score})\n\n"
-        response_text += "---\n\n"
+        parts = [f"🔮 **Semantic Search Results**\n\n"]
+        parts.append(f"🎯 Vibe Query: \"{vibe_query}\"\n")
+        parts.append(f"📊 Found {len(results)} match(es) (min score: {min_score})\n\n")
+        parts.append("---\n\n")
         
-        for i, poi in enumerate(results, 1):
-            stars = poi.get("prestige", {}).get("michelin_stars")
-            stars_str = f" {'⭐' * stars}" if stars else ""
-            score = poi.get("similarity_score", 0)
-            
-            response_text += f"**{i}. {poi['name']}**{stars_str}\n"
-            response_text += f"   📍 {poi.get('address', {}).get('neighborhood', 'N/A')}\n"
-            response_text += f"   🎯 Similarity: {score:.2f} | "
-            response_text += f"Prestige: {poi.get('prestige', {}).get('score', 0)}\n"
-            response_text += f"   💰 {poi.get('experience', {}).get('price_range', 'N/A')} · "
-            
-            # Category and cuisines
-            cat = poi.get('category', 'restaurant')
-            subcats = poi.get('subcategories', [])
-            if subcats:
-                response_text += f"{', '.join(subcats[:2])}\n"
-            else:
-                response_text += f"{cat}\n"
-            
-            # Why it matches
-            ambiance = poi.get('experience', {}).get('ambiance', [])
-            if ambiance:
-                response_text += f"   ✨ Ambiance: {', '.join(ambiance[:3])}\n"
-            
-            occasions = poi.get('best_for', {}).get('occasions', [])
-            if occasions:
-                response_text += f"   🎉 Best for: {', '.join(occasions[:2])}\n"
-            
-            # Signature dishes
-            dishes = poi.get('experience', {}).get('signature_dishes', [])
-            if dishes:
-                response_text += f"   🍽️ Signature: {', '.join(dishes[:2])}\n"
-            
-            response_text += f"   📞 {poi.get('contact', {}).get('phone', 'N/A')}\n\n"
+        parts.extend(render_vibe_result(i, poi) for i, poi in enumerate(results, 1))
         
-        return [types.TextContent(type="text", text=response_text)]
+        return [types.TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         error_text = f"❌ Vector search failed: {str(e)}\n\n"
@@ -716,22 +1264,39 @@ async def search_by_vibe_tool(args: Dict[str, Any]) -> list[types.TextContent]:
 
 
 async def init_mongo() -> bool:
-    """Initialize MongoDB connection"""
+    """Initialize MongoDB connection (once; every tool call shares this client)"""
     global mongo_client
     
+    if mongo_client is not None:
+        return True
+    
     print("🔌 Connecting to MongoDB...", file=sys.stderr)
-    mongo_client = MongoDBClient()
+    client = AsyncMongoDBClient(
+        config.mongodb.uri,
+        config.mongodb.database,
+        config.mongodb.pois_collection,
+        **config.mongodb.client_kwargs()
+    )
     
-    if not mongo_client.connect():
+    if not await client.connect():
         print("❌ Failed to connect to MongoDB", file=sys.stderr)
         return False
+    mongo_client = client
     
     print(f"✅ Connected to MongoDB: {mongo_client.database_name}", file=sys.stderr)
     print(f"📦 Collection: {mongo_client.collection_name}", file=sys.stderr)
     
-    # Get POI count
-    count = mongo_client.pois.count_documents({})
-    print(f"🗄️  POIs available: {count}", file=sys.stderr)
+    # $geoNear needs a 2dsphere index and the tool filters want theirs too;
+    # missing ones are only reported (setup_indexes creates them)
+    try:
+        await mongo_client.verify_query_indexes()
+    except Exception as e:
+        print(f"⚠️  Could not verify indexes: {e}", file=sys.stderr)
+    
+    # Get POI count (from collection metadata; count_documents would scan the collection)
+    if config.verbose_startup:
+        count = await mongo_client.pois.estimated_document_count()
+        print(f"🗄️  POIs available: {count}", file=sys.stderr)
     return True
 
 
@@ -741,7 +1306,7 @@ async def init_openai() -> bool:
     
     try:
         print("🤖 Initializing OpenAI client...", file=sys.stderr)
-        openai_client = OpenAI(api_key=config.openai.api_key)
+        openai_client = AsyncOpenAI(api_key=config.openai.api_key)
         print(f"✅ OpenAI initialized: {config.openai.embedding_model}", file=sys.stderr)
         return True
     except Exception as e:
@@ -758,6 +1323,8 @@ async def main():
     # Initialize OpenAI (optional - server works without it)
     await init_openai()
     
+    start_cache_warmer()
+    
     print("\n🚀 NYC POI Concierge MCP Server starting...", file=sys.stderr)
     print("="*60, file=sys.stderr)
     
@@ -7,12 +7,8 @@ from mcp.server.sse import SseServerTransport
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions
 import sys
-from pathlib import Path
 
-# Add current directory to sys.path to import server
-sys.path.append(str(Path(__file__).parent))
-
-from server import server, init_mongo
+from .server import server, init_mongo, start_cache_warmer
 
 # Create SSE transport
 sse = SseServerTransport("/messages")
@@ -49,6 +45,7 @@ async def startup():
     if not success:
         print("❌ Failed to initialize MongoDB")
         sys.exit(1)
+    start_cache_warmer()
 
 if __name__ == "__main__":
     # Run on 0.0.0.0 to be accessible via LAN
@@ -0,0 +1 @@
+"""Shared MongoDB, cache and scoring helpers"""
@@ -0,0 +1,198 @@
+"""
+Two-tier response cache for MCP tool results.
+
+L1 is an in-process TLRUCache; L2 is an optional Redis shared across
+processes. Entries stay servable for a stale-while-revalidate window after
+their TTL: a stale hit is returned immediately and refreshed in the
+background, so callers only ever wait on a cold miss.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from cachetools import TLRUCache
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    # Redis is optional; without it the cache is in-process only
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(name: str, args: dict) -> str:
+    """Stable cache key for a tool name plus its (canonicalized) arguments"""
+    payload = orjson.dumps(sorted(args.items()), default=str)
+    return f"{name}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+class ResponseCache:
+    """Cache-aside store with an L1 TLRUCache, optional Redis L2 and SWR refresh"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        default_ttl: int = 30,
+        swr_window: int = 120,
+        maxsize: int = 1024,
+        namespace: str = "nyc-poi",
+        l1_ttl: Optional[float] = None,
+    ):
+        # Redis keys are "<namespace>:<key>" and invalidate() scans
+        # "<namespace>:*", so a namespace containing ":" could match (and
+        # wipe) another cache's keys
+        if ":" in namespace:
+            raise ValueError(f"Cache namespace must not contain ':' (got {namespace!r})")
+        self.default_ttl = default_ttl
+        self.swr_window = swr_window
+        self.namespace = namespace
+        self.l1_ttl = l1_ttl
+        # Entries are (value, fresh_until); each lives through its own SWR
+        # window (so a longer per-call ttl is honored), or at most `l1_ttl`
+        # seconds when set, so other processes' invalidations (which clear
+        # Redis but not this process's L1) are seen that soon
+        self._l1: TLRUCache = TLRUCache(maxsize=maxsize, ttu=self._l1_expiry, timer=time.time)
+        self._refreshing: set = set()
+        self._tasks: set = set()
+
+        self._redis = None
+        if redis_url:
+            if aioredis is None:
+                logger.warning("REDIS_URL is set but redis is not installed; using in-process cache only")
+            else:
+                self._redis = aioredis.from_url(redis_url)
+
+    def _l1_expiry(self, _key: str, entry: tuple, now: float) -> float:
+        expires = entry[1] + self.swr_window
+        return min(expires, now + self.l1_ttl) if self.l1_ttl else expires
+
+    async def _l2_get(self, key: str) -> Optional[tuple]:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(f"{self.namespace}:{key}")
+        except Exception as e:
+            logger.warning(f"Redis get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        entry = orjson.loads(raw)
+        return entry["v"], entry["t"]
+
+    async def _store(self, key: str, value: Any, ttl: int):
+        fresh_until = time.time() + ttl
+        self._l1[key] = (value, fresh_until)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                f"{self.namespace}:{key}",
+                orjson.dumps({"v": value, "t": fresh_until}, default=str),
+                ex=ttl + self.swr_window,
+            )
+        except Exception as e:
+            logger.warning(f"Redis set failed: {e}")
+
+    def _revalidate(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ):
+        """Refresh a stale entry in the background (at most one refresh per key)"""
+        if key in self._refreshing:
+            return
+
+        async def _refresh():
+            try:
+                value = await compute()
+                if cacheable is None or cacheable(value):
+                    await self._store(key, value, ttl)
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(_refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        *,
+        refresh: bool = False,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for `key`, computing (and storing) it on a miss.
+
+        `refresh` skips the lookup and replaces any cached entry; values for
+        which `cacheable` returns False are returned but not stored.
+        """
+        ttl = ttl or self.default_ttl
+
+        entry = None
+        if not refresh:
+            entry = self._l1.get(key)
+            if entry is None:
+                entry = await self._l2_get(key)
+                if entry is not None:
+                    self._l1[key] = entry
+
+        if entry is not None:
+            value, fresh_until = entry
+            if time.time() >= fresh_until:
+                self._revalidate(key, compute, ttl, cacheable)
+            return value
+
+        value = await compute()
+        if cacheable is None or cacheable(value):
+            await self._store(key, value, ttl)
+        return value
+
+    def cached(
+        self,
+        name: Optional[str] = None,
+        ttl: Optional[int] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ):
+        """Decorator caching an async function on its bound arguments (see get_or_compute for `cacheable`)"""
+
+        def decorator(fn):
+            signature = inspect.signature(fn)
+            key_name = name or fn.__name__
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = make_key(key_name, bound.arguments)
+                return await self.get_or_compute(key, lambda: fn(*args, **kwargs), ttl, cacheable=cacheable)
+
+            return wrapper
+
+        return decorator
+
+    async def invalidate(self):
+        """Drop every cached entry (call after POI data changes)"""
+        self._l1.clear()
+        if self._redis is None:
+            return
+        try:
+            keys = [key async for key in self._redis.scan_iter(match=f"{self.namespace}:*")]
+            if keys:
+                await self._redis.unlink(*keys)
+        except Exception as e:
+            logger.warning(f"Redis invalidation failed: {e}")
@@ -14,12 +14,51 @@ logger = logging.getLogger(__name__)
 
 try:
     from pymongo import MongoClient, GEOSPHERE, ASCENDING, DESCENDING
-    from pymongo.errors import ConnectionFailure, OperationFailure
+    from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
 except ImportError:
     logger.info("Installing pymongo...")
     os.system("python3 -m pip install pymongo")
     from pymongo import MongoClient, GEOSPHERE, ASCENDING, DESCENDING
-    from pymongo.errors import ConnectionFailure, OperationFailure
+    from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
+
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+except ImportError:
+    # Only the async servers need Motor; the sync scripts work without it
+    AsyncIOMotorClient = None
+
+
+# POI documents hold only strings, numbers, arrays, sub-documents and naive
+# datetimes, so the collection decodes into plain dicts with no tz or UUID
+# conversion, whatever options the client URI carries
+POI_CODEC_OPTIONS = CodecOptions(
+    document_class=dict,
+    tz_aware=False,
+    uuid_representation=UuidRepresentation.UNSPECIFIED,
+)
+
+# $geoNear needs exactly one 2dsphere index; prestige.score and category ride
+# along in it so $geoNear.query filters are checked during the IXSCAN
+GEO_INDEX = (
+    [("location", GEOSPHERE), ("prestige.score", DESCENDING), ("category", ASCENDING)],
+    "location_prestige_category",
+)
+
+# Filters the MCP tools apply after $geoNear ($match on category/prestige/stars,
+# and the contextual tool's budget filter)
+FILTER_INDEXES = (
+    (
+        [("category", ASCENDING), ("prestige.score", DESCENDING), ("prestige.michelin_stars", DESCENDING)],
+        "category_prestige_stars",
+    ),
+    ([("experience.price_range", ASCENDING)], "price_range"),
+)
+
+# Documents per insert_many in import_pois
+IMPORT_BATCH_SIZE = 1000
 
 
 class MongoDBClient:
@@ -29,9 +68,15 @@ class MongoDBClient:
         self,
         uri: str = None,
         database: str = "nyc-poi",
-        collection: str = "pois"
+        collection: str = "pois",
+        **client_options
     ):
-        """Initialize MongoDB connection"""
+        """
+        Initialize MongoDB connection.
+        
+        Extra keyword arguments (compressors, readPreference, ...) are passed
+        straight to MongoClient.
+        """
         self.uri = uri or os.getenv("MONGODB_URI")
         
         if not self.uri:
@@ -39,6 +84,11 @@ class MongoDBClient:
         
         self.database_name = database
         self.collection_name = collection
+        self.client_options = {
+            "serverSelectionTimeoutMS": 5000,
+            "maxPoolSize": 100,
+            **client_options
+        }
         
         # Connection
         self.client: Optional[MongoClient] = None
@@ -50,18 +100,14 @@ class MongoDBClient:
         try:
             logger.info(f"🔌 Connecting to MongoDB Atlas...")
             
-            self.client = MongoClient(
-                self.uri,
-                serverSelectionTimeoutMS=5000,
-                maxPoolSize=10
-            )
+            self.client = MongoClient(self.uri, **self.client_options)
             
             # Test connection
             self.client.admin.command('ping')
             
             # Get database and collection
             self.db = self.client[self.database_name]
-            self.pois = self.db[self.collection_name]
+            self.pois = self.db.get_collection(self.collection_name, codec_options=POI_CODEC_OPTIONS)
             
             logger.info(f"✅ Connected to database: {self.database_name}")
             logger.info(f"✅ Using collection: {self.collection_name}")
@@ -85,11 +131,15 @@ class MongoDBClient:
             logger.info("\n📇 Setting up indexes...")
             
             # 1. Geospatial Index (required for location queries)
-            logger.info("  Creating geospatial index on 'location'...")
-            self.pois.create_index(
-                [("location", GEOSPHERE)],
-                name="location_2dsphere"
-            )
+            # prestige.score and category ride along in the 2dsphere index so
+            # $geoNear.query filters are checked during the IXSCAN instead of
+            # after fetching each document. $geoNear needs a single 2dsphere
+            # index, so the older location-only index is dropped.
+            logger.info("  Creating geospatial + prestige + category index...")
+            if "location_2dsphere" in self.pois.index_information():
+                self.pois.drop_index("location_2dsphere")
+            keys, name = GEO_INDEX
+            self.pois.create_index(keys, name=name)
             
             # 2. Category and Prestige Index
             logger.info("  Creating category + prestige index...")
@@ -126,6 +176,11 @@ class MongoDBClient:
                 name="validation_status"
             )
             
+            # 6. MCP tool filter indexes
+            logger.info("  Creating tool filter indexes...")
+            for keys, name in FILTER_INDEXES:
+                self.pois.create_index(keys, name=name)
+            
             logger.info("✅ All indexes created successfully")
             
             # List all indexes
@@ -157,16 +212,25 @@ class MongoDBClient:
             
             logger.info(f"\n📥 Importing {len(pois)} POIs...")
             
-            # Add metadata
-            for poi in pois:
-                if "created_at" not in poi:
-                    poi["created_at"] = datetime.now().isoformat()
-                poi["updated_at"] = datetime.now().isoformat()
-            
-            # Bulk insert
-            result = self.pois.insert_many(pois, ordered=False)
+            # Bulk insert in fixed-size batches; a rejected document (e.g. a
+            # duplicate _id) only costs itself, not the rest of its batch
+            # One timestamp for the whole import
+            now_iso = datetime.now().isoformat()
+            inserted_count = 0
+            for start in range(0, len(pois), IMPORT_BATCH_SIZE):
+                batch = pois[start:start + IMPORT_BATCH_SIZE]
+                
+                # Add metadata
+                for poi in batch:
+                    poi.setdefault("created_at", now_iso)
+                    poi["updated_at"] = now_iso
+                
+                try:
+                    inserted_count += len(self.pois.insert_many(batch, ordered=False).inserted_ids)
+                except BulkWriteError as e:
+                    inserted_count += e.details.get("nInserted", 0)
+                    logger.warning(f"⚠️  {len(e.details.get('writeErrors', []))} POIs rejected in batch at {start}")
             
-            inserted_count = len(result.inserted_ids)
             logger.info(f"✅ Imported {inserted_count} POIs successfully")
             
             return inserted_count
@@ -183,17 +247,23 @@ class MongoDBClient:
         try:
             stats = self.db.command("collStats", self.collection_name)
             
-            # Get category breakdown
-            category_counts = {}
-            for category in ["fine-dining", "casual-dining", "bars-cocktails"]:
-                count = self.pois.count_documents({"category": category})
-                category_counts[category] = count
-            
-            # Get prestige distribution
-            michelin_counts = {}
-            for stars in [1, 2, 3]:
-                count = self.pois.count_documents({"prestige.michelin_stars": stars})
-                michelin_counts[f"{stars}_star"] = count
+            # Category and Michelin breakdowns from one pass over the collection
+            category_counts = dict.fromkeys(["fine-dining", "casual-dining", "bars-cocktails"], 0)
+            michelin_counts = {f"{stars}_star": 0 for stars in [1, 2, 3]}
+            groups = self.pois.aggregate([
+                {"$group": {
+                    "_id": {"category": "$category", "stars": "$prestige.michelin_stars"},
+                    "count": {"$sum": 1}
+                }}
+            ])
+            for group in groups:
+                category = group["_id"].get("category")
+                stars = group["_id"].get("stars")
+                if category in category_counts:
+                    category_counts[category] += group["count"]
+                # Stars may be stored as ints or doubles (count_documents matched both)
+                if type(stars) in (int, float) and stars in (1, 2, 3):
+                    michelin_counts[f"{int(stars)}_star"] += group["count"]
             
             return {
                 "total_pois": stats.get("count", 0),
@@ -273,6 +343,102 @@ class MongoDBClient:
             logger.info("\n👋 MongoDB connection closed")
 
 
+class AsyncMongoDBClient:
+    """
+    Async (Motor) MongoDB client for the HTTP and MCP servers.
+
+    Every operation on `pois` is awaitable, so a Mongo round-trip no longer
+    blocks the event loop while other requests are waiting.
+    """
+    
+    def __init__(
+        self,
+        uri: str = None,
+        database: str = "nyc-poi",
+        collection: str = "pois",
+        **client_options
+    ):
+        """
+        Initialize MongoDB connection settings.
+        
+        Extra keyword arguments (maxPoolSize, minPoolSize, socketTimeoutMS, ...)
+        are passed straight to AsyncIOMotorClient.
+        """
+        if AsyncIOMotorClient is None:
+            raise ImportError("motor is required for AsyncMongoDBClient. Install it with: pip install motor")
+        
+        self.uri = uri or os.getenv("MONGODB_URI")
+        
+        if not self.uri:
+            raise ValueError("MongoDB URI is required. Set MONGODB_URI environment variable or pass uri parameter.")
+        
+        self.database_name = database
+        self.collection_name = collection
+        self.client_options = {
+            "serverSelectionTimeoutMS": 5000,
+            "maxPoolSize": 100,
+            **client_options
+        }
+        
+        # Connection
+        self.client: Optional[AsyncIOMotorClient] = None
+        self.db = None
+        self.pois = None
+    
+    async def connect(self) -> bool:
+        """Establish connection to MongoDB Atlas"""
+        try:
+            logger.info(f"🔌 Connecting to MongoDB Atlas (async)...")
+            
+            self.client = AsyncIOMotorClient(self.uri, **self.client_options)
+            
+            # Test connection
+            await self.client.admin.command('ping')
+            
+            # Get database and collection
+            self.db = self.client[self.database_name]
+            self.pois = self.db.get_collection(self.collection_name, codec_options=POI_CODEC_OPTIONS)
+            
+            logger.info(f"✅ Connected to database: {self.database_name}")
+            logger.info(f"✅ Using collection: {self.collection_name}")
+            
+            return True
+            
+        except ConnectionFailure as e:
+            logger.error(f"❌ MongoDB connection failed: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Unexpected error: {e}")
+            return False
+    
+    async def verify_query_indexes(self) -> List[str]:
+        """
+        Check that the indexes the query tools rely on exist.
+
+        Nothing is created here: building indexes on every server start would
+        contend with live traffic, so that stays with setup_indexes()
+        (python -m src.utils.mongodb) and the import scripts. Any missing
+        index is logged and its name returned.
+        """
+        info = await self.pois.index_information()
+        key_specs = [list(index["key"]) for index in info.values()]
+        missing = []
+        # $geoNear fails outright without a 2dsphere index on location (any
+        # one will do; a second would make $geoNear ambiguous)
+        if not any(field == "location" and kind == GEOSPHERE for spec in key_specs for field, kind in spec):
+            missing.append(GEO_INDEX[1])
+        missing.extend(name for keys, name in FILTER_INDEXES if keys not in key_specs)
+        if missing:
+            logger.warning(f"⚠️  Missing query indexes: {', '.join(missing)} (run setup_indexes to create them)")
+        return missing
+    
+    def close(self):
+        """Close MongoDB connection"""
+        if self.client:
+            self.client.close()
+            logger.info("\n👋 MongoDB connection closed")
+
+
 def main():
     """Test MongoDB connection and setup"""
     
@@ -0,0 +1,54 @@
+"""
+Helpers for trimming POI documents to the fields a client actually renders,
+so embeddings, enrichment blobs, and other heavy fields never leave MongoDB.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+# Fields the mobile app reads from a POI (see frontend/expo-app/services/mcpService.ts)
+POI_CLIENT_FIELDS: tuple[str, ...] = (
+    "name",
+    "category",
+    "subcategories",
+    "location",
+    "address",
+    "prestige",
+    "contact",
+    "experience",
+    "best_for",
+    "media",
+    "branding",
+    "distance",
+)
+
+# Exclusion projection for whole-document reads (refresh, detail views):
+# the vector and its source text are never needed outside Atlas Search
+EMBEDDING_EXCLUSION: dict[str, int] = {
+    "embedding": 0,
+    "embedding_text": 0,
+    "embedding_model": 0,
+    "embedding_dimensions": 0,
+}
+
+
+def project_fields(
+    fields: Iterable[str] | None = None,
+    *,
+    required: Iterable[str] = (),
+) -> dict[str, Any]:
+    """
+    Build a `$project` stage keeping `fields` (default: POI_CLIENT_FIELDS)
+    plus any `required` paths the caller needs for its own bookkeeping.
+
+    Paths already covered by a projected parent (e.g. `prestige.score` when
+    `prestige` is kept) are dropped, since MongoDB rejects path collisions.
+    """
+    names = set(fields or POI_CLIENT_FIELDS) | set(required)
+    spec = {
+        name: 1
+        for name in sorted(names)
+        if not any(name.startswith(f"{parent}.") for parent in names)
+    }
+    return {"$project": spec}
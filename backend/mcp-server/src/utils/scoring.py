@@ -1,12 +1,22 @@
 """
 Utility helpers for building MongoDB aggregation expressions that combine
 prestige, proximity, and contextual signals into hybrid scores.
+
+The builders are memoized on their (hashable) inputs, so the common request
+shapes reuse one prebuilt expression. Callers must treat the returned
+expressions as read-only.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Iterable, Sequence
 
+# Meal period by hour of day: lunch 11-15, dinner 17-23, otherwise "any"
+TIME_OF_DAY_BY_HOUR: tuple[str, ...] = (
+    ("any",) * 11 + ("lunch",) * 4 + ("any",) * 2 + ("dinner",) * 6 + ("any",)
+)
+
 
 def _sum_components(components: Sequence[Any], default: int | float = 0) -> Any:
     """
@@ -33,6 +43,11 @@ def hybrid_score_expression(
     Build an expression that blends prestige with proximity and lightweight
     categorical boosts.
     """
+    return _hybrid_score_expression(radius_meters, tuple(sorted(categories)) if categories else None)
+
+
+@lru_cache(maxsize=256)
+def _hybrid_score_expression(radius_meters: int, categories: tuple[str, ...] | None) -> Any:
     components: list[Any] = [
         {"$multiply": ["$prestige.score", 0.55]},
         {
@@ -57,6 +72,7 @@ def hybrid_score_expression(
     return _sum_components(components)
 
 
+@lru_cache(maxsize=256)
 def contextual_boost_expression(
     *,
     occasion: str | None = None,
@@ -118,7 +134,7 @@ def contextual_boost_expression(
         components.append(
             {
                 "$cond": [
-                    {"$eq": [budget, {"$ifNull": ["$experience.price_range", budget]}]},
+                    {"$eq": [{"$literal": budget}, {"$ifNull": ["$experience.price_range", {"$literal": budget}]}]},
                     5,
                     0,
                 ]
@@ -128,6 +144,146 @@ def contextual_boost_expression(
     return _sum_components(components)
 
 
+@lru_cache(maxsize=256)
+def context_reasons_expression(
+    *,
+    occasion: str | None = None,
+    time_of_day: str | None = None,
+    weather: str | None = None,
+    budget: str | None = None,
+) -> Any:
+    """
+    Build an array expression listing the context signals a POI matches,
+    as display labels ("date night", "dinner", "rain friendly", "matches budget").
+    """
+    checks: list[tuple[Any, str]] = []
+
+    if occasion:
+        checks.append(
+            ({"$in": [{"$literal": occasion}, {"$ifNull": ["$best_for.occasions", []]}]}, occasion.replace("-", " "))
+        )
+    if time_of_day:
+        checks.append(
+            ({"$in": [{"$literal": time_of_day}, {"$ifNull": ["$best_for.time_of_day", []]}]}, time_of_day)
+        )
+    if weather:
+        checks.append(
+            ({"$in": [{"$literal": weather}, {"$ifNull": ["$best_for.weather", []]}]}, f"{weather} friendly")
+        )
+    if budget:
+        checks.append(({"$eq": ["$experience.price_range", {"$literal": budget}]}, "matches budget"))
+
+    return _matched_labels([(check, {"$literal": label}) for check, label in checks])
+
+
+@lru_cache(maxsize=256)
+def recommendation_reasons_expression(
+    *,
+    occasion: str | None = None,
+    time_of_day: str | None = None,
+    weather: str | None = None,
+    budget: str | None = None,
+) -> Any:
+    """
+    Build the "why this recommendation" labels for contextual recommendations
+    ("Perfect for date night", "Dinner", "rain friendly", "Budget match",
+    "2-Michelin-star", "Very close"), in that order.
+    """
+    checks: list[tuple[Any, Any]] = []
+
+    if occasion:
+        checks.append((
+            {"$in": [{"$literal": occasion}, {"$ifNull": ["$best_for.occasions", []]}]},
+            {"$literal": f"Perfect for {occasion.replace('-', ' ')}"},
+        ))
+    if time_of_day:
+        checks.append((
+            {"$in": [{"$literal": time_of_day}, {"$ifNull": ["$best_for.time_of_day", []]}]},
+            {"$literal": time_of_day.title()},
+        ))
+    if weather and weather != "any":
+        checks.append((
+            {"$in": [{"$literal": weather}, {"$ifNull": ["$best_for.weather", []]}]},
+            {"$literal": f"{weather} friendly"},
+        ))
+    if budget:
+        checks.append(({"$eq": ["$experience.price_range", {"$literal": budget}]}, {"$literal": "Budget match"}))
+    checks.append((
+        {"$gt": [{"$ifNull": ["$prestige.michelin_stars", 0]}, 0]},
+        {"$concat": [{"$toString": {"$toInt": "$prestige.michelin_stars"}}, "-Michelin-star"]},
+    ))
+    checks.append(({"$lt": [{"$ifNull": ["$distance", 0]}, 1000]}, {"$literal": "Very close"}))
+
+    return _matched_labels(checks)
+
+
+def _matched_labels(checks: list[tuple[Any, Any]]) -> Any:
+    """Array of the label expressions whose check holds, in order."""
+    if not checks:
+        return {"$literal": []}
+    return {
+        "$filter": {
+            "input": [{"$cond": [check, label, None]} for check, label in checks],
+            "as": "reason",
+            "cond": {"$ne": ["$$reason", None]},
+        }
+    }
+
+
+def _add_terms(expression: Any) -> list[Any]:
+    """The operands of a bare `$add` expression, or the expression itself."""
+    if isinstance(expression, dict) and expression.keys() == {"$add"}:
+        return list(expression["$add"])
+    return [expression]
+
+
+def composite_score_expression(
+    radius_meters: int,
+    *,
+    categories: Iterable[str] | None = None,
+    occasion: str | None = None,
+    time_of_day: str | None = None,
+    weather: str | None = None,
+    group_size: int | None = None,
+    budget: str | None = None,
+) -> Any:
+    """
+    Build hybrid score plus contextual boost as one flat `$add`, so a
+    pipeline can compute and sort on a single field instead of adding the
+    hybrid, contextual, and combined scores separately.
+    """
+    return _composite_score_expression(
+        radius_meters,
+        tuple(sorted(categories)) if categories else None,
+        occasion,
+        time_of_day,
+        weather,
+        group_size,
+        budget,
+    )
+
+
+@lru_cache(maxsize=256)
+def _composite_score_expression(
+    radius_meters: int,
+    categories: tuple[str, ...] | None,
+    occasion: str | None,
+    time_of_day: str | None,
+    weather: str | None,
+    group_size: int | None,
+    budget: str | None,
+) -> Any:
+    hybrid = _hybrid_score_expression(radius_meters, categories)
+    context = contextual_boost_expression(
+        occasion=occasion,
+        time_of_day=time_of_day,
+        weather=weather,
+        group_size=group_size,
+        budget=budget,
+    )
+    return _sum_components(_add_terms(hybrid) + _add_terms(context))
+
+
 def combine_score_components(*components: Any, default: int | float = 0) -> Any:
     """Convenience wrapper for blending multiple expressions."""
     return _sum_components(list(components), default=default)
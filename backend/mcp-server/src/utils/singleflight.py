@@ -0,0 +1,33 @@
+"""
+Request coalescing ("singleflight") for duplicate concurrent work.
+
+While a coroutine for a key is in flight, other callers with the same key
+await its result instead of starting their own Mongo/Tavily round-trips.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def single(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run `coro_factory()` once per key at a time; concurrent callers share the result"""
+    fut = _inflight.get(key)
+    if fut is not None:
+        # shield: a cancelled waiter must not cancel the leader's work
+        return await asyncio.shield(fut)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await coro_factory()
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved so lone failures don't log "never retrieved"
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
@@ -3,28 +3,84 @@ Tavily-powered Real-time POI Enrichment
 For last-minute sanity checks during demos
 """
 
+import asyncio
+import logging
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from cachetools import TTLCache
+
+from .cache import make_key
+from .singleflight import single
+
 try:
-    from tavily import TavilyClient
+    from tavily import AsyncTavilyClient
 except ImportError:
     import subprocess
     subprocess.run(["pip", "install", "tavily-python"], check=True)
-    from tavily import TavilyClient
+    from tavily import AsyncTavilyClient
+
+# stdout carries the stdio MCP transport, so diagnostics go through logging
+logger = logging.getLogger(__name__)
+
+
+# enrich_poi's queries, in order, and the enrichment field each answer fills
+ENRICHMENT_FIELDS = (
+    "holiday_hours",
+    "special_events",
+    "recent_news",
+    "social_buzz",
+    "current_availability",
+    "latest_recognition",
+)
+
+
+# Tavily responses by exact query and search options, shared by every
+# enricher: repeat enrichments and refreshes of a POI within the hour reuse
+# them, and the hour keeps holiday hours and availability fresh
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+
+@lru_cache(maxsize=None)
+def get_tavily_client(api_key: str) -> AsyncTavilyClient:
+    """
+    Shared async Tavily client per API key.
+    
+    Reusing one client keeps its HTTP connection pool warm across enrichments
+    instead of paying a fresh TCP + TLS handshake for every TavilyEnricher.
+    """
+    return AsyncTavilyClient(api_key=api_key)
 
 
 class TavilyEnricher:
     """Real-time POI enrichment using Tavily for trusted source validation"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[AsyncTavilyClient] = None):
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         
         if not self.api_key:
             raise ValueError("TAVILY_API_KEY environment variable required")
         
-        self.client = TavilyClient(api_key=self.api_key)
+        self.client = client or get_tavily_client(self.api_key)
+    
+    async def search(self, query: str, **options) -> Dict[str, Any]:
+        """
+        Tavily search through the shared hour-long cache; concurrent
+        duplicates share one request, and failures and empty responses
+        (no answer or results) aren't cached.
+        Callers must treat the returned response as read-only.
+        """
+        key = make_key("tavily", {"query": query, **options})
+        response = _search_cache.get(key)
+        if response is None:
+            response = await single(key, lambda: self.client.search(query=query, **options))
+            # An empty result is often transient (rate limiting, index lag),
+            # so it's retried next time instead of pinned for the hour
+            if response.get("answer") or response.get("results"):
+                _search_cache[key] = response
+        return response
     
     async def enrich_poi(
         self,
@@ -52,9 +108,12 @@ class TavilyEnricher:
             Dict with enrichment data from trusted sources
         """
         
-        # Check if it's near a major holiday
+        # Check if it's near a major holiday (one clock read, so the query
+        # dates and enriched_at always agree)
         now = datetime.now()
         upcoming_holiday = self._get_upcoming_holiday(now)
+        year = now.year
+        month_year = now.strftime('%B %Y')
         
         # Build targeted queries for different aspects
         queries = [
@@ -65,21 +124,21 @@ class TavilyEnricher:
             f"{poi_name} NYC {upcoming_holiday} menu special prix fixe tasting menu seasonal",
             
             # Recent news and changes
-            f"{poi_name} NYC {now.year} news chef change menu update reopening renovation",
+            f"{poi_name} NYC {year} news chef change menu update reopening renovation",
             
             # Social media buzz (what's trending RIGHT NOW)
-            f"{poi_name} NYC Instagram latest posts trending dishes must try {now.strftime('%B %Y')}",
+            f"{poi_name} NYC Instagram latest posts trending dishes must try {month_year}",
             
             # Current availability
             f"{poi_name} NYC reservations OpenTable Resy availability {upcoming_holiday}",
             
             # Awards and recognition (recent)
-            f"{poi_name} NYC Michelin {now.year} awards James Beard New York Times review latest"
+            f"{poi_name} NYC Michelin {year} awards James Beard New York Times review latest"
         ]
         
         enrichment_data = {
             "poi_name": poi_name,
-            "enriched_at": datetime.now().isoformat(),
+            "enriched_at": now.isoformat(),
             "source": "tavily_realtime",
             "holiday_hours": "",  # NEW: Critical for Thanksgiving demo!
             "special_events": "",  # NEW: Prix fixe menus, etc.
@@ -103,45 +162,38 @@ class TavilyEnricher:
             "exploretock.com"  # Reservation system
         ]
         
-        # Execute the Tavily searches!
-        for idx, query in enumerate(queries):
-            try:
-                response = self.client.search(
-                    query=query,
+        # Execute the Tavily searches concurrently (one round-trip of latency, not six)
+        responses = await asyncio.gather(
+            *(
+                self.search(
+                    query,
                     search_depth="advanced",
                     include_domains=trusted_domains,
                     include_answer=True,
                     max_results=3
                 )
-                
-                # Extract answer
-                answer = response.get("answer", "")
-                if answer:
-                    # Categorize based on query index
-                    if idx == 0:  # Holiday hours
-                        enrichment_data["holiday_hours"] = answer
-                    elif idx == 1:  # Special events
-                        enrichment_data["special_events"] = answer
-                    elif idx == 2:  # Recent news
-                        enrichment_data["recent_news"] = answer
-                    elif idx == 3:  # Social buzz
-                        enrichment_data["social_buzz"] = answer
-                    elif idx == 4:  # Availability
-                        enrichment_data["current_availability"] = answer
-                    elif idx == 5:  # Recognition
-                        enrichment_data["latest_recognition"] = answer
-                
-                # Collect citations
-                for result in response.get("results", [])[:2]:
-                    enrichment_data["citations"].append({
-                        "url": result.get("url"),
-                        "title": result.get("title"),
-                        "source": result.get("url", "").split("/")[2] if result.get("url") else "unknown"
-                    })
-                
-            except Exception as e:
-                print(f"Warning: Enrichment query {idx} failed: {e}")
+                for query in queries
+            ),
+            return_exceptions=True
+        )
+        
+        for idx, (field, response) in enumerate(zip(ENRICHMENT_FIELDS, responses)):
+            if isinstance(response, BaseException):
+                logger.warning(f"Enrichment query {idx} failed: {response}")
                 continue
+            
+            # Extract answer
+            answer = response.get("answer", "")
+            if answer:
+                enrichment_data[field] = answer
+            
+            # Collect citations
+            for result in response.get("results", [])[:2]:
+                enrichment_data["citations"].append({
+                    "url": result.get("url"),
+                    "title": result.get("title"),
+                    "source": result.get("url", "").split("/")[2] if result.get("url") else "unknown"
+                })
         
         return enrichment_data
     
@@ -187,41 +239,46 @@ async def enrich_poi_live(
             poi_address=poi_address,
             category=category
         )
-        
-        # Format for display
-        response = f"📍 **{poi_name}** - Real-time Updates\n\n"
-        
-        if enrichment.get("latest_buzz") and enrichment["latest_buzz"].strip():
-            response += f"🔥 **Latest Buzz:**\n{enrichment['latest_buzz'].strip()}\n\n"
-        
-        if enrichment.get("menu_highlights") and enrichment["menu_highlights"].strip():
-            response += f"🍽️ **Menu Highlights:**\n{enrichment['menu_highlights'].strip()}\n\n"
-        
-        if enrichment.get("availability_context") and enrichment["availability_context"].strip():
-            response += f"⏰ **Reservations & Hours:**\n{enrichment['availability_context'].strip()}\n\n"
-        
-        if enrichment.get("social_vibe") and enrichment["social_vibe"].strip():
-            response += f"📱 **Social Media Vibe:**\n{enrichment['social_vibe'].strip()}\n\n"
-        
-        # Add citations
-        citations = enrichment.get("citations", [])
-        if citations:
-            response += f"📚 **Verified Sources:**\n"
-            seen_sources = set()
-            for citation in citations:
-                source = citation.get("source", "")
-                if source and source not in seen_sources:
-                    seen_sources.add(source)
-                    response += f"  • {source}\n"
-        
-        response += f"\n_✅ Verified via Tavily • {enrichment['enriched_at']}_"
-        
-        return response
+        return format_enrichment(poi_name, enrichment)
         
     except Exception as e:
         return f"❌ Failed to enrich {poi_name}: {str(e)}\n\nThis tool requires TAVILY_API_KEY to be set in your environment."
 
 
+def format_enrichment(poi_name: str, enrichment: Dict[str, Any]) -> str:
+    """Chat-ready text for a TavilyEnricher.enrich_poi result"""
+    
+    # Format for display
+    response = f"📍 **{poi_name}** - Real-time Updates\n\n"
+    
+    if enrichment.get("latest_buzz") and enrichment["latest_buzz"].strip():
+        response += f"🔥 **Latest Buzz:**\n{enrichment['latest_buzz'].strip()}\n\n"
+    
+    if enrichment.get("menu_highlights") and enrichment["menu_highlights"].strip():
+        response += f"🍽️ **Menu Highlights:**\n{enrichment['menu_highlights'].strip()}\n\n"
+    
+    if enrichment.get("availability_context") and enrichment["availability_context"].strip():
+        response += f"⏰ **Reservations & Hours:**\n{enrichment['availability_context'].strip()}\n\n"
+    
+    if enrichment.get("social_vibe") and enrichment["social_vibe"].strip():
+        response += f"📱 **Social Media Vibe:**\n{enrichment['social_vibe'].strip()}\n\n"
+    
+    # Add citations
+    citations = enrichment.get("citations", [])
+    if citations:
+        response += f"📚 **Verified Sources:**\n"
+        seen_sources = set()
+        for citation in citations:
+            source = citation.get("source", "")
+            if source and source not in seen_sources:
+                seen_sources.add(source)
+                response += f"  • {source}\n"
+    
+    response += f"\n_✅ Verified via Tavily • {enrichment['enriched_at']}_"
+    
+    return response
+
+
 async def refresh_poi_data(poi: Dict[str, Any]) -> Dict[str, Any]:
     """
     Refresh specific POI fields using Tavily for latest web data
@@ -238,17 +295,6 @@ async def refresh_poi_data(poi: Dict[str, Any]) -> Dict[str, Any]:
     address = poi.get("address", {})
     street = address.get("street", "")
     
-    # Call the enhanced enrich_poi method for full Thanksgiving data!
-    print(f"🔍 Calling enrich_poi for {poi_name}...")
-    enrichment = await enricher.enrich_poi(
-        poi_name=poi_name,
-        poi_address=street,
-        category=poi.get("category", "restaurant")
-    )
-    print(f"✅ Enrichment received: {enrichment is not None}")
-    if enrichment:
-        print(f"   Keys: {enrichment.keys()}")
-    
     # Build targeted queries for refreshable data
     queries = {
         "contact": f"{poi_name} {street} NYC phone number website contact",
@@ -256,23 +302,40 @@ async def refresh_poi_data(poi: Dict[str, Any]) -> Dict[str, Any]:
         "social": f"{poi_name} NYC Instagram Twitter Facebook social media handles"
     }
     
+    # Call the enhanced enrich_poi method for full Thanksgiving data! Its
+    # searches and the refresh queries all go out in one concurrent fan-out
+    logger.debug(f"Refreshing {poi_name} with enrich_poi")
+    enrichment, *responses = await asyncio.gather(
+        enricher.enrich_poi(
+            poi_name=poi_name,
+            poi_address=street,
+            category=poi.get("category", "restaurant")
+        ),
+        *(
+            enricher.search(
+                query,
+                search_depth="advanced",
+                include_answer=True,
+                max_results=3
+            )
+            for query in queries.values()
+        ),
+        return_exceptions=True
+    )
+    if isinstance(enrichment, BaseException):
+        raise enrichment
+    
     updated_data = {
         "contact": {},
         "hours": {},
         "social": {},
         "enrichment_data": enrichment  # Include full enrichment!
     }
-    print(f"📦 Updated data keys: {updated_data.keys()}")
-    print(f"📦 Has enrichment_data: {updated_data.get('enrichment_data') is not None}")
     
-    for field, query in queries.items():
+    for field, response in zip(queries, responses):
         try:
-            response = enricher.client.search(
-                query=query,
-                search_depth="advanced",
-                include_answer=True,
-                max_results=3
-            )
+            if isinstance(response, BaseException):
+                raise response
             
             answer = response.get("answer", "")
             
@@ -300,7 +363,7 @@ async def refresh_poi_data(poi: Dict[str, Any]) -> Dict[str, Any]:
                 }
                 
         except Exception as e:
-            print(f"Warning: Failed to refresh {field} for {poi_name}: {e}")
+            logger.warning(f"Failed to refresh {field} for {poi_name}: {e}")
             continue
     
     return updated_data
@@ -106,4 +106,4 @@ print("\n🚀 MCP Server is ready to run!")
 print("\nTo start the server:")
 print("  cd backend/mcp-server")
 print("  export $(cat ../../.env | grep -v '^#' | xargs)")
-print("  python3 src/server.py")
+print("  python3 -m src.server")
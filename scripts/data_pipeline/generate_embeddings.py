@@ -14,6 +14,7 @@ import os
 import sys
 import argparse
 from typing import List, Dict, Any
+from bson.binary import Binary, BinaryVectorDtype
 from pymongo import MongoClient
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -146,7 +147,8 @@ def generate_embeddings(dry_run: bool = False) -> None:
                 dimensions=config.openai.embedding_dimensions
             )
             
-            embedding_vector = response.data[0].embedding
+            # Stored as float32 binData: half the bytes of an array of doubles
+            embedding_vector = Binary.from_vector(response.data[0].embedding, BinaryVectorDtype.FLOAT32)
             
             # Update MongoDB document
             pois_collection.update_one(
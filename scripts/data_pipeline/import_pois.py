@@ -6,7 +6,7 @@ Imports 7 curated POIs to MongoDB Atlas
 
 import json
 import os
-from pymongo import MongoClient, GEOSPHERE
+from pymongo import MongoClient, GEOSPHERE, ASCENDING, DESCENDING
 
 print('=' * 70)
 print('NYC POI MongoDB Import')
@@ -46,7 +46,12 @@ try:
     
     # Create geospatial index
     print('\n📇 Creating geospatial index...')
-    pois_collection.create_index([('location', GEOSPHERE)], name='location_2dsphere')
+    if 'location_2dsphere' in pois_collection.index_information():
+        pois_collection.drop_index('location_2dsphere')
+    pois_collection.create_index(
+        [('location', GEOSPHERE), ('prestige.score', DESCENDING), ('category', ASCENDING)],
+        name='location_prestige_category'
+    )
     print('   ✅ Index created')
     
     # Import POIs
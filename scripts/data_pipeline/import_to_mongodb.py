@@ -86,10 +86,20 @@ class MongoDBClient:
             print("\n📇 Setting up indexes...")
             
             # 1. Geospatial Index (required for location queries)
-            print("  Creating geospatial index on 'location'...")
+            # prestige.score and category ride along in the 2dsphere index so
+            # $geoNear.query filters are checked during the IXSCAN instead of
+            # after fetching each document. $geoNear needs a single 2dsphere
+            # index, so the older location-only index is dropped.
+            print("  Creating geospatial + prestige + category index...")
+            if "location_2dsphere" in self.pois.index_information():
+                self.pois.drop_index("location_2dsphere")
             self.pois.create_index(
-                [("location", GEOSPHERE)],
-                name="location_2dsphere"
+                [
+                    ("location", GEOSPHERE),
+                    ("prestige.score", DESCENDING),
+                    ("category", ASCENDING)
+                ],
+                name="location_prestige_category"
             )
             
             # 2. Category and Prestige Index
@@ -145,11 +155,11 @@ class MongoDBClient:
             
             print(f"\n📥 Importing {len(pois)} POIs...")
             
-            # Add metadata
+            # Add metadata (one timestamp for the whole import)
+            now_iso = datetime.now().isoformat()
             for poi in pois:
-                if "created_at" not in poi:
-                    poi["created_at"] = datetime.now().isoformat()
-                poi["updated_at"] = datetime.now().isoformat()
+                poi.setdefault("created_at", now_iso)
+                poi["updated_at"] = now_iso
             
             # Bulk insert
             result = self.pois.insert_many(pois, ordered=False)
@@ -41,4 +41,4 @@ echo "="
 echo ""
 
 # Run MCP Inspector
-npx @modelcontextprotocol/inspector python3 src/server.py
+npx @modelcontextprotocol/inspector python3 -m src.server
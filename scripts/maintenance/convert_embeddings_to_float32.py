@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Rewrite POI embeddings stored as BSON arrays of doubles into float32 binData vectors.
+
+Atlas Vector Search indexes float32 binData vectors directly; storing them
+that way halves each embedding (4 bytes per dimension instead of 8) and the
+vector index memory with it. New embeddings from generate_embeddings.py are
+already written in this format, so this is a one-off for older documents.
+
+Usage:
+    python3 convert_embeddings_to_float32.py
+    python3 convert_embeddings_to_float32.py --dry-run  # Count without updating
+"""
+
+import os
+import sys
+import argparse
+from bson.binary import Binary, BinaryVectorDtype
+from pymongo import MongoClient, UpdateOne
+from dotenv import load_dotenv
+
+# Add backend/mcp-server to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../backend/mcp-server'))
+from src.config import config
+
+load_dotenv()
+
+BATCH_SIZE = 100
+
+
+def convert_embeddings(dry_run: bool = False) -> None:
+    """
+    Convert every array-valued `embedding` to a float32 binData vector.
+
+    Args:
+        dry_run: If True, only report how many POIs would be converted
+    """
+    print("🔌 Connecting to MongoDB Atlas...")
+    mongo_client = MongoClient(
+        config.mongodb.uri,
+        maxPoolSize=config.mongodb.max_pool_size,
+        serverSelectionTimeoutMS=config.mongodb.server_selection_timeout_ms
+    )
+    pois_collection = mongo_client[config.mongodb.database][config.mongodb.pois_collection]
+
+    query = {"embedding": {"$type": "array"}}
+    total_pois = pois_collection.count_documents(query)
+    print(f"📊 Found {total_pois} POIs with array embeddings")
+
+    if total_pois == 0 or dry_run:
+        if dry_run and total_pois:
+            print(f"💡 Run without --dry-run to convert all {total_pois} POIs")
+        mongo_client.close()
+        return
+
+    converted = 0
+    batch = []
+    for poi in pois_collection.find(query, {"embedding": 1}):
+        vector = Binary.from_vector(poi["embedding"], BinaryVectorDtype.FLOAT32)
+        batch.append(UpdateOne({"_id": poi["_id"]}, {"$set": {"embedding": vector}}))
+        if len(batch) == BATCH_SIZE:
+            converted += pois_collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+            print(f"✅ [{converted}/{total_pois}]")
+    if batch:
+        converted += pois_collection.bulk_write(batch, ordered=False).modified_count
+
+    print(f"\n🎉 Converted {converted} embeddings to float32 binData")
+    print("   The existing 'vector_index' definition keeps working unchanged")
+
+    mongo_client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert POI embeddings to float32 binData vectors")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count array embeddings without updating the database"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        convert_embeddings(dry_run=args.dry_run)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        sys.exit(1)
@@ -13,6 +13,7 @@ Usage:
 
 import sys
 import os
+from bson.binary import Binary, BinaryVectorDtype
 from openai import OpenAI
 from pymongo import MongoClient
 from dotenv import load_dotenv
@@ -60,8 +61,8 @@ def test_vibe_search(vibe_query: str, limit: int = 5, min_score: float = 0.7):
             "$vectorSearch": {
                 "index": "vector_index",
                 "path": "embedding",
-                "queryVector": query_vector,
-                "numCandidates": 100,
+                "queryVector": Binary.from_vector(query_vector, BinaryVectorDtype.FLOAT32),
+                "numCandidates": 150,
                 "limit": limit * 2
             }
         },
@@ -0,0 +1,6 @@
+"""Unit tests import the backend modules directly (no MongoDB, Redis or API keys needed)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../backend/mcp-server"))
@@ -0,0 +1,204 @@
+"""ResponseCache (src/utils/cache.py): keys, stale-while-revalidate and invalidation."""
+
+import asyncio
+import fnmatch
+
+import pytest
+
+from src.utils import cache as cache_module
+from src.utils.cache import ResponseCache, make_key
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls ResponseCache makes"""
+
+    def __init__(self, store=None):
+        self.store = {} if store is None else store
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def scan_iter(self, match):
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def unlink(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+def _with_redis(cache, store):
+    cache._redis = FakeRedis(store)
+    return cache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+def test_make_key_ignores_argument_order():
+    assert make_key("query_pois", {"a": 1, "b": [1, 2]}) == make_key("query_pois", {"b": [1, 2], "a": 1})
+
+
+def test_make_key_separates_tools_and_arguments():
+    assert make_key("query_pois", {"a": 1}) != make_key("search_by_vibe", {"a": 1})
+    assert make_key("query_pois", {"a": 1}) != make_key("query_pois", {"a": 2})
+
+
+def test_namespace_with_colon_is_rejected():
+    with pytest.raises(ValueError):
+        ResponseCache(namespace="nyc-poi:enrichment")
+
+
+def test_miss_computes_once_then_hits():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"v": len(calls)}
+
+    async def run():
+        cache = ResponseCache(default_ttl=30)
+        first = await cache.get_or_compute("k", compute)
+        second = await cache.get_or_compute("k", compute)
+        return first, second
+
+    assert asyncio.run(run()) == ({"v": 1}, {"v": 1})
+    assert len(calls) == 1
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(clock):
+    values = iter(["old", "new"])
+
+    async def compute():
+        return next(values)
+
+    async def run():
+        cache = ResponseCache(default_ttl=30, swr_window=120)
+        assert await cache.get_or_compute("k", compute) == "old"
+        clock.now += 31  # past the TTL, inside the SWR window
+        stale = await cache.get_or_compute("k", compute)
+        await asyncio.gather(*cache._tasks)
+        fresh = await cache.get_or_compute("k", compute)
+        return stale, fresh
+
+    assert asyncio.run(run()) == ("old", "new")
+
+
+def test_longer_per_call_ttl_outlives_the_default_window(clock):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        cache = ResponseCache(default_ttl=30, swr_window=120)
+        await cache.get_or_compute("warmed", compute, ttl=3600)
+        await cache.get_or_compute("regular", compute)
+        clock.now += 1000  # well past default_ttl + swr_window
+        return (
+            await cache.get_or_compute("warmed", compute),
+            await cache.get_or_compute("regular", compute),
+        )
+
+    assert asyncio.run(run()) == (1, 3)
+
+
+def test_uncacheable_values_are_not_stored():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return []
+
+    async def run():
+        cache = ResponseCache()
+        for _ in range(2):
+            await cache.get_or_compute("k", compute, cacheable=bool)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_cached_decorator_skips_uncacheable_results():
+    cache = ResponseCache()
+    calls = []
+
+    @cache.cached("check_poi_freshness", cacheable=lambda result: "error" not in result)
+    async def check(poi_id):
+        calls.append(poi_id)
+        return {"error": "POI not found"} if poi_id == "missing" else {"is_fresh": True}
+
+    async def run():
+        for poi_id in ("missing", "missing", "found", "found"):
+            await check(poi_id)
+
+    asyncio.run(run())
+    assert calls == ["missing", "missing", "found"]
+
+
+def test_l2_entries_are_shared_between_processes():
+    store = {}
+
+    async def run():
+        writer = _with_redis(ResponseCache(), store)
+        reader = _with_redis(ResponseCache(), store)
+        await writer.get_or_compute("k", lambda: asyncio.sleep(0, result={"pois": [1]}))
+
+        async def unexpected():
+            raise AssertionError("should be an L2 hit")
+
+        return await reader.get_or_compute("k", unexpected)
+
+    assert asyncio.run(run()) == {"pois": [1]}
+
+
+def test_invalidate_only_clears_its_own_namespace():
+    store = {}
+
+    async def run():
+        tools = _with_redis(ResponseCache(namespace="nyc-poi"), store)
+        enrichment = _with_redis(ResponseCache(namespace="nyc-poi-enrichment"), store)
+        await tools.get_or_compute("query_pois:abc", lambda: asyncio.sleep(0, result="q"))
+        await enrichment.get_or_compute("enrich_poi_live:def", lambda: asyncio.sleep(0, result="e"))
+        await tools.invalidate()
+
+    asyncio.run(run())
+    assert list(store) == ["nyc-poi-enrichment:enrich_poi_live:def"]
+
+
+def test_invalidation_reaches_other_processes_after_l1_ttl():
+    store = {}
+    versions = iter(["old", "new"])
+
+    async def run():
+        worker_a = _with_redis(ResponseCache(l1_ttl=0.05), store)
+        worker_b = _with_redis(ResponseCache(l1_ttl=0.05), store)
+        compute = lambda: asyncio.sleep(0, result=next(versions))
+        await worker_a.get_or_compute("k", compute)
+        assert await worker_b.get_or_compute("k", compute) == "old"
+
+        await worker_a.invalidate()
+        # worker_b's L1 still holds the pre-invalidation value...
+        assert await worker_b.get_or_compute("k", compute) == "old"
+        # ...until l1_ttl expires and it falls through to the cleared L2
+        await asyncio.sleep(0.06)
+        return await worker_b.get_or_compute("k", compute)
+
+    assert asyncio.run(run()) == "new"
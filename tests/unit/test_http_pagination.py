@@ -0,0 +1,91 @@
+"""Keyset pagination cursors for /query-pois (http_server.encode_page_cursor / keyset_match)."""
+
+from bson import ObjectId
+
+from http_server import encode_page_cursor, keyset_match
+
+
+def _field(doc, path):
+    for part in path.split("."):
+        if not isinstance(doc, dict) or part not in doc:
+            return None
+        doc = doc[part]
+    return doc
+
+
+def _matches(doc, query):
+    """Just enough of MongoDB's $match semantics for keyset_match's output"""
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(doc, branch) for branch in condition):
+                return False
+            continue
+        value = _field(doc, key)
+        if isinstance(condition, dict):
+            (op, bound), = condition.items()
+            # Comparisons only match values of the same type bracket (never null)
+            if value is None or type(value) is not type(bound) and not (
+                isinstance(value, (int, float)) and isinstance(bound, (int, float))
+            ):
+                return False
+            if op == "$lt" and not value < bound:
+                return False
+            if op == "$gt" and not value > bound:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _sorted(pois, distance_first):
+    """The server's sort: prestige.score descending with null last, distance ascending, then _id"""
+    def key(poi):
+        score = _field(poi, "prestige.score")
+        score_key = (1, 0) if score is None else (0, -score)
+        if distance_first:
+            return (poi["distance"], score_key, poi["_id"])
+        return (score_key, poi["distance"], poi["_id"])
+    return sorted(pois, key=key)
+
+
+def _paginate(pois, distance_first, page_size):
+    remaining = _sorted(pois, distance_first)
+    pages, cursor = [], None
+    while True:
+        candidates = remaining if cursor is None else [
+            poi for poi in remaining if _matches(poi, keyset_match(cursor, distance_first))
+        ]
+        page = _sorted(candidates, distance_first)[:page_size]
+        if not page:
+            return pages
+        pages.append(page)
+        cursor = encode_page_cursor(page[-1])
+
+
+def _pois():
+    pois = []
+    for i, (score, distance) in enumerate([
+        (150, 900.0), (100, 300.0), (100, 300.0), (50, 120.0), (50, 800.0),
+        (None, 50.0), (None, 400.0), (0, 400.0), (100, 1200.0), (None, 400.0),
+    ]):
+        poi = {"_id": ObjectId(f"{i:024x}"), "distance": distance}
+        if score is not None:
+            poi["prestige"] = {"score": score}
+        pois.append(poi)
+    return pois
+
+
+def test_cursor_round_trips_across_page_boundaries():
+    pois = _pois()
+    for distance_first in (False, True):
+        for page_size in (1, 2, 3, 4):
+            pages = _paginate(pois, distance_first, page_size)
+            flat = [poi["_id"] for page in pages for poi in page]
+            assert flat == [poi["_id"] for poi in _sorted(pois, distance_first)]
+
+
+def test_cursor_for_poi_without_prestige_encodes_null_score():
+    poi = {"_id": ObjectId(), "distance": 10.0}
+    match = keyset_match(encode_page_cursor(poi), distance_first=False)
+    # Only other unscored POIs can follow an unscored one
+    assert all(branch.get("prestige.score", None) is None for branch in match["$or"])
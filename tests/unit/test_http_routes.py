@@ -0,0 +1,52 @@
+"""HTTP routes return plain dicts that ORJSONRoute encodes (http_server.ORJSONRoute)."""
+
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+import http_server
+from src import config as config_module
+from src.utils.cache import ResponseCache
+
+POI_ID = ObjectId()
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def batch_size(self, size):
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Routes read config.mongodb, which requires a URI (nothing connects to it)
+    monkeypatch.setenv("MONGODB_URI", "mongodb://localhost:27017")
+    config_module._env_snapshot.cache_clear()
+    docs = [{"_id": POI_ID, "name": "Le Bernardin", "prestige": {"score": 140}, "distance": 120.5}]
+    pois = SimpleNamespace(aggregate=lambda pipeline: FakeCursor(docs))
+    monkeypatch.setattr(http_server, "query_cache", ResponseCache(default_ttl=60, swr_window=0))
+    monkeypatch.setattr(http_server.app.state, "mongo", SimpleNamespace(pois=pois), raising=False)
+    # No context manager, so the lifespan (real MongoDB connection) doesn't run
+    yield TestClient(http_server.app)
+    config_module._env_snapshot.cache_clear()
+
+
+def test_query_pois_encodes_object_ids_from_a_plain_dict(client):
+    response = client.post("/query-pois", json={"latitude": 40.7614, "longitude": -73.9818, "limit": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 1
+    assert body["pois"][0]["_id"] == str(POI_ID)
+    assert body["next_cursor"] is None
+
+
+def test_handler_errors_keep_their_status(client):
+    response = client.post("/pois/refresh-batch", json={"ids": ["not-an-object-id"]})
+    assert response.status_code == 400
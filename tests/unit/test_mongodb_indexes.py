@@ -0,0 +1,36 @@
+"""Startup index check (AsyncMongoDBClient.verify_query_indexes): report only, never create."""
+
+import asyncio
+
+from src.utils.mongodb import FILTER_INDEXES, GEO_INDEX, AsyncMongoDBClient
+
+
+class FakePois:
+    def __init__(self, indexes):
+        self.indexes = indexes
+
+    async def index_information(self):
+        return {name: {"key": keys} for keys, name in self.indexes}
+
+    async def create_index(self, *args, **kwargs):
+        raise AssertionError("verify_query_indexes must not create indexes")
+
+
+def _client(indexes):
+    client = AsyncMongoDBClient.__new__(AsyncMongoDBClient)
+    client.pois = FakePois([([("_id", 1)], "_id_"), *indexes])
+    return client
+
+
+def test_all_indexes_present():
+    assert asyncio.run(_client([GEO_INDEX, *FILTER_INDEXES]).verify_query_indexes()) == []
+
+
+def test_missing_indexes_are_reported():
+    missing = asyncio.run(_client([FILTER_INDEXES[0]]).verify_query_indexes())
+    assert missing == [GEO_INDEX[1], *(name for _, name in FILTER_INDEXES[1:])]
+
+
+def test_any_location_2dsphere_index_satisfies_geo():
+    legacy_geo = ([("location", "2dsphere")], "location_2dsphere")
+    assert asyncio.run(_client([legacy_geo, *FILTER_INDEXES]).verify_query_indexes()) == []
@@ -0,0 +1,88 @@
+"""Tool-cache keys for the stdio server (src/server.py _cache_key, cached recommendations)."""
+
+import asyncio
+import time
+
+import pytest
+
+from src import server
+from src.server import _cache_key
+from src.utils.cache import ResponseCache
+
+
+def test_list_order_does_not_change_the_key():
+    assert _cache_key("query_pois", {"categories": ["bars", "fine-dining"]}) == _cache_key(
+        "query_pois", {"categories": ["fine-dining", "bars"]}
+    )
+
+
+def test_mixed_type_and_dict_lists_are_keyed():
+    first = _cache_key("query_pois", {"filters": [{"b": 1, "a": 2}, 3, "x", None]})
+    second = _cache_key("query_pois", {"filters": ["x", None, 3, {"b": 1, "a": 2}]})
+    assert first == second
+
+
+def test_nearby_coordinates_share_a_key():
+    assert _cache_key("query_pois", {"latitude": 40.71281, "longitude": -74.00601}) == _cache_key(
+        "query_pois", {"latitude": 40.71279, "longitude": -74.00598}
+    )
+
+
+class FakeClock:
+    def __init__(self, hour):
+        self.hour = hour
+
+    def __call__(self):
+        return time.struct_time((2026, 10, 16, self.hour, 30, 0, 4, 289, 0))
+
+
+@pytest.fixture
+def recommendations(monkeypatch):
+    """contextual_recommendations_tool with a fresh cache and a counting fake aggregation"""
+    calls = []
+    clock = FakeClock(hour=16)
+
+    async def fake_aggregate(pipeline, limit):
+        calls.append(pipeline)
+        return [{"name": f"POI {len(calls)}", "distance": 120, "prestige_score": 120}]
+
+    monkeypatch.setattr(server, "_aggregate", fake_aggregate)
+    monkeypatch.setattr(server, "tool_cache", ResponseCache(default_ttl=30))
+    monkeypatch.setattr(server, "openai_client", None)
+    monkeypatch.setattr(server.time, "localtime", clock)
+
+    async def call(**args):
+        [content] = await server.contextual_recommendations_tool(args)
+        return content.text
+
+    return call, calls, clock
+
+
+def test_recommendations_key_follows_the_time_of_day_bucket(recommendations):
+    call, calls, clock = recommendations
+
+    async def run():
+        await call(latitude=40.7128, longitude=-74.006)
+        await call(latitude=40.7128, longitude=-74.006)
+        clock.hour = 19
+        await call(latitude=40.7128, longitude=-74.006)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_recommendations_header_is_rendered_per_call(recommendations):
+    call, calls, clock = recommendations
+    clock.hour = 15
+
+    async def run():
+        first = await call(latitude=40.7126, longitude=-74.006)
+        clock.hour = 16
+        second = await call(latitude=40.7134, longitude=-74.006)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(calls) == 1
+    assert "40.7126, -74.0060" in first and "03:30 PM" in first
+    assert "40.7134, -74.0060" in second and "04:30 PM" in second
+    assert "POI 1" in second
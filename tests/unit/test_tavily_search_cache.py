@@ -0,0 +1,46 @@
+"""TavilyEnricher.search caching: only responses with content are kept."""
+
+import asyncio
+
+import pytest
+
+from src.utils import tavily_enrichment
+from src.utils.tavily_enrichment import TavilyEnricher
+
+
+class FakeTavily:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    async def search(self, query, **options):
+        self.calls += 1
+        return self.response
+
+
+@pytest.fixture(autouse=True)
+def empty_search_cache(monkeypatch):
+    monkeypatch.setattr(tavily_enrichment, "_search_cache", {})
+
+
+def _search_twice(response):
+    tavily_enrichment._search_cache.clear()
+    client = FakeTavily(response)
+    enricher = TavilyEnricher(api_key="test", client=client)
+
+    async def run():
+        await enricher.search("Le Bernardin holiday hours", max_results=3)
+        await enricher.search("Le Bernardin holiday hours", max_results=3)
+
+    asyncio.run(run())
+    return client.calls
+
+
+def test_responses_with_content_are_cached():
+    assert _search_twice({"answer": "Open 5-10pm", "results": []}) == 1
+    assert _search_twice({"answer": "", "results": [{"url": "https://example.com"}]}) == 1
+
+
+def test_empty_responses_are_retried():
+    assert _search_twice({"answer": "", "results": []}) == 2
+    assert _search_twice({"answer": None}) == 2